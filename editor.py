@@ -6,7 +6,12 @@ Supports single-tile and multi-tile brushes, per-tile metadata editing,
 and custom collision polygons.
 """
 
+import math
+from collections import deque
+
+import numpy as np
 import pygame
+import pygame.gfxdraw
 
 from settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
@@ -14,13 +19,12 @@ from settings import (
     COLOR_GRAY, COLOR_RED,
 )
 from tile_defs import (
-    TILE_SIZE, GRID_COLS, GRID_ROWS,
+    TILE_SIZE, LOG2_TILE_SIZE, GRID_COLS, GRID_ROWS,
     T_EMPTY, T_FINISH, TILE_BASE,
     is_driveable, get_tile_sprite,
     GRASS_COLOR, GRASS_DARK,
-    empty_terrain, empty_rotations,
 )
-from tile_meta import get_manager, CATEGORY_DISPLAY
+from tile_meta import get_manager, CATEGORY_DISPLAY, SAVE_DELAY
 from tile_brush import Brush, BrushLibrary
 from editor_panels import (
     TilesetBrowser, ToolsPanel, PropertyInspector,
@@ -48,6 +52,15 @@ ZOOM_MIN = 0.1
 ZOOM_MAX = 2.0
 ZOOM_STEP = 0.08
 MAX_UNDO = 30
+TEXT_CACHE_SIZE = 64  # rendered UI strings kept by _render_cached
+TINT_POOL_SIZE = 32  # translucent fill blocks kept by _blit_tint
+CHUNK_TILES = 8  # terrain is pre-rendered in CHUNK_TILES x CHUNK_TILES blocks
+PALETTE_MAX_TILE_PX = 6  # at or below this on-screen size, 1 colour per tile
+
+# ── Grid storage ──
+# Tile IDs go past 255 (TILE_BASE + ~2000 tileset tiles), rotations are 0-3.
+TERRAIN_DTYPE = np.uint16
+ROTATION_DTYPE = np.uint8
 
 # ── UI colors ──
 COL_BAR = (20, 20, 20, 200)
@@ -58,6 +71,75 @@ COL_INPUT_BG = (40, 40, 55)
 COL_TOOL_BG = (35, 40, 50)
 
 
+# Help overlay text (rendered once into a panel by _build_help_panel)
+HELP_LINES = (
+    "=== TILE EDITOR ===",
+    "",
+    "Left-click         Paint brush",
+    "Left-drag          Paint continuously",
+    "Right-click        Erase",
+    "",
+    "Middle-drag        Pan viewport",
+    "Space+drag         Pan viewport",
+    "Scroll             Zoom in/out",
+    "",
+    "Tileset: click     Select 1 tile",
+    "Tileset: drag      Select rectangle",
+    "Tileset: scroll    Zoom tileset",
+    "Tileset: R-drag    Pan tileset",
+    "Tabs               Filter by category",
+    "",
+    "R / Shift+R        Rotate tile CW/CCW",
+    "Shift+1/2/3        Brush size",
+    "Ctrl+Z / Ctrl+Y   Undo / Redo",
+    "Ctrl+S             Save track",
+    "Ctrl+O             Load track",
+    "Ctrl+N             New track",
+    "F                  Fit view",
+    "T                  Test track",
+    "C                  Checkpoint mode",
+    "  drag=place, R-click=delete",
+    "D                  Direction mode",
+    "  drag=set arrow, R-click=delete",
+    "P                  Power-up zone mode",
+    "  drag=place, R-click=delete",
+    "H                  Toggle help",
+    "ESC                Back to menu",
+    "",
+    "Property Inspector (right panel):",
+    "  Click fields to cycle values",
+)
+
+
+def new_terrain():
+    """Creates an empty (GRID_ROWS, GRID_COLS) terrain array (all grass)."""
+    return np.zeros((GRID_ROWS, GRID_COLS), dtype=TERRAIN_DTYPE)
+
+
+def new_rotations():
+    """Creates an empty (GRID_ROWS, GRID_COLS) rotations array (all 0)."""
+    return np.zeros((GRID_ROWS, GRID_COLS), dtype=ROTATION_DTYPE)
+
+
+def tile_line(r0, c0, r1, c1):
+    """Grid cells from (r0, c0) to (r1, c1) inclusive (Bresenham)."""
+    dr, dc = abs(r1 - r0), abs(c1 - c0)
+    sr = 1 if r1 > r0 else -1
+    sc = 1 if c1 > c0 else -1
+    err = dc - dr
+    cells = [(r0, c0)]
+    while (r0, c0) != (r1, c1):
+        e2 = 2 * err
+        if e2 > -dr:
+            err -= dr
+            c0 += sc
+        if e2 < dc:
+            err += dc
+            r0 += sr
+        cells.append((r0, c0))
+    return cells
+
+
 class TileEditor:
     """Professional tile editor with panel-based UI."""
 
@@ -67,9 +149,9 @@ class TileEditor:
         self.font_big = pygame.font.SysFont("consolas", 22, bold=True)
         self.font_small = pygame.font.SysFont("consolas", 12)
 
-        # Tile data
-        self.terrain = empty_terrain()
-        self.rotations = empty_rotations()
+        # Tile data (ndarrays indexed [row, col])
+        self.terrain = new_terrain()
+        self.rotations = new_rotations()
         self.current_rotation = 0  # 0-3: 0/90/180/270 degrees
 
         # Viewport
@@ -81,6 +163,9 @@ class TileEditor:
         self.panning = False
         self.pan_start = (0, 0)
         self.pan_cam_start = (0, 0)
+        self._space_held = False  # tracked from KEYDOWN/KEYUP (space+drag)
+        self._mouse_pos = pygame.mouse.get_pos()  # updated from mouse events
+        self._hover = (None, None)  # (cursor/camera key, cell) for _hover_cell
 
         # Painting
         self.painting = False
@@ -91,19 +176,40 @@ class TileEditor:
         self.selected_tile = T_EMPTY  # for Grass/Finish quick-select compat
 
         # Undo/Redo
-        self.undo_stack = []
-        self.redo_stack = []
+        self.undo_stack = deque(maxlen=MAX_UNDO)  # oldest drops off in O(1)
+        self.redo_stack = deque(maxlen=MAX_UNDO)
+        # Grid contents when the current stroke began (buffers reused by
+        # every stroke); diffed against the live grid when it ends
+        self._stroke_terrain = new_terrain()
+        self._stroke_rotations = new_rotations()
+        self._stroke_open = False
+        self._stroke_cell = None     # last (row, col) stamped by the drag
+
+        # Circuit validation: (metadata revision, tile ID -> driveable)
+        self._driveable_lut = (None, None)
 
         # UI state
         self.show_help = False
         self.status_msg = ""
         self.status_timer = 0.0
+        self._help_surf = None          # (font, Surface) help panel, built on first show
+        self._text_cache = {}           # (text, font, color) -> Surface
+        self._status_line = (None, None)  # (key, Surface) last status bar render
+        self._input_line = (None, None)   # (text, Surface) save dialog input
+        # Persistent translucent backgrounds (filled once, blitted per frame).
+        # Persistent surfaces are kept in the display's pixel format so
+        # blits skip per-pixel conversion; the display is set up once.
+        self._bar_surf = self._tint_surface((SCREEN_WIDTH, STATUS_BAR_H),
+                                            COL_BAR)
+        self._dialog_bgs = {}           # (w, h) -> dialog background
+        self._tint_surfs = {}           # (rgba, w, h) rounded to 32 -> Surface
 
         # Dialog
         self.dialog_mode = None
         self.dialog_input = ""
         self.dialog_tracks = []
         self.dialog_selected = 0
+        self._track_rows = {}   # (name, type, selected) -> (name, type) renders
 
         # Track info
         self.current_filename = None
@@ -135,7 +241,34 @@ class TileEditor:
 
         # Build preview sprites
         from tile_defs import make_grass_sprite
-        self._grass_sprite = make_grass_sprite()
+        self._grass_sprite = make_grass_sprite().convert()
+        # One chunk's worth of grass, for chunk blocks with no tiles at all
+        side = CHUNK_TILES * TILE_SIZE
+        self._grass_block = pygame.Surface((side, side), 0, self.screen)
+        self._grass_block.blits(
+            [(self._grass_sprite, (x, y))
+             for y in range(0, side, TILE_SIZE)
+             for x in range(0, side, TILE_SIZE)], doreturn=False)
+        self._scaled_cache = {}         # key -> sprite at _scaled_cache_size
+        self._scaled_cache_size = None  # on-screen tile size the cache holds
+
+        # Pre-rendered terrain chunks, keyed (chunk_row, chunk_col)
+        self._chunks = {}               # key -> world-resolution surface
+        self._dirty_chunks = {}         # key -> stale cells (r0, c0, r1, c1)
+        self._chunk_scaled = {}         # key -> surface at _chunk_scaled_zoom
+        self._chunk_scaled_zoom = None
+        self._grid_strips = None        # (alpha, vertical, horizontal)
+
+        # Low-zoom terrain: one pixel per tile in the tile's average colour
+        self._tile_colors = {}          # tile_id -> (r, g, b)
+        self._palette_surf = None       # (GRID_COLS, GRID_ROWS) surface
+        self._palette_scaled = None     # (zoom, scaled surface)
+
+        # Last rendered viewport, reused on frames where nothing changed
+        self._viewport_cache = pygame.Surface(
+            (SCREEN_WIDTH, VIEWPORT_HEIGHT), 0, self.screen)
+        self._viewport_key = None       # (zoom, cam_x, cam_y) it was drawn at
+        self._viewport_dirty = True     # set by events and terrain edits
 
         # ── Panels ──
         self.tools_panel = ToolsPanel(pygame.Rect(
@@ -146,6 +279,11 @@ class TileEditor:
             SCREEN_WIDTH - INSPECTOR_W, VIEWPORT_HEIGHT,
             INSPECTOR_W, BOTTOM_PANEL_H))
 
+        self._panels = (self.tools_panel, self.browser_panel,
+                        self.inspector_panel)
+        for panel in self._panels:
+            panel.mouse_pos = self._mouse_pos
+
         # Wire callbacks
         self.browser_panel.on_tile_selected = self._on_tile_selected
         self.browser_panel.on_brush_selected = self._on_brush_selected
@@ -201,6 +339,7 @@ class TileEditor:
     def _open_collision_editor(self, tile_id):
         from editor_collision import CollisionEditor
         self._collision_editor = CollisionEditor(self.screen, tile_id)
+        self._collision_editor.mouse_pos = self._mouse_pos
 
     # ──────────────────────────────────────────
     # COORDINATE TRANSFORMS
@@ -216,9 +355,22 @@ class TileEditor:
         wy = (sy - VIEWPORT_HEIGHT / 2) / self.zoom + self.cam_y
         return wx, wy
 
+    def tile_transform(self):
+        """Return (step, off_x, off_y) so tile (row, col) sits on screen at
+        (col * step + off_x, row * step + off_y)."""
+        step = TILE_SIZE * self.zoom
+        off_x = SCREEN_WIDTH / 2 - self.cam_x * self.zoom
+        off_y = VIEWPORT_HEIGHT / 2 - self.cam_y * self.zoom
+        return step, off_x, off_y
+
     def screen_to_tile(self, sx, sy):
-        wx, wy = self.screen_to_world(sx, sy)
-        return int(wy // TILE_SIZE), int(wx // TILE_SIZE)
+        # screen_to_world inlined: this runs on every mouse motion event
+        inv_zoom = 1.0 / self.zoom
+        wx = (sx - SCREEN_WIDTH / 2) * inv_zoom + self.cam_x
+        wy = (sy - VIEWPORT_HEIGHT / 2) * inv_zoom + self.cam_y
+        # floor() first so the shift also rounds down for negative coords
+        return (math.floor(wy) >> LOG2_TILE_SIZE,
+                math.floor(wx) >> LOG2_TILE_SIZE)
 
     # ──────────────────────────────────────────
     # HIT TESTING
@@ -227,84 +379,196 @@ class TileEditor:
     def _is_in_viewport(self, sx, sy):
         return 0 <= sx < SCREEN_WIDTH and 0 <= sy < VIEWPORT_HEIGHT
 
+    def _hover_cell(self):
+        """(row, col) under the cursor while it is over the viewport (may be
+        off the grid), else None. Shared by the status bar and the hover
+        preview, and recomputed only when the cursor or camera moved."""
+        key = (self._mouse_pos, self.zoom, self.cam_x, self.cam_y)
+        if key != self._hover[0]:
+            mx, my = self._mouse_pos
+            cell = (self.screen_to_tile(mx, my)
+                    if self._is_in_viewport(mx, my) else None)
+            self._hover = (key, cell)
+        return self._hover[1]
+
     def _is_in_panel(self, sx, sy):
         return sy >= VIEWPORT_HEIGHT and sy < SCREEN_HEIGHT - STATUS_BAR_H
 
+    @staticmethod
+    def _zone_at(zones, wx, wy):
+        """Index of the first [x, y, w, h] zone containing the world point,
+        or -1. Plain comparisons: no Rect is built per zone."""
+        px, py = int(wx), int(wy)  # truncated like Rect.collidepoint does
+        for i, z in enumerate(zones):
+            if z[0] <= px < z[0] + z[2] and z[1] <= py < z[1] + z[3]:
+                return i
+        return -1
+
     # ──────────────────────────────────────────
     # UNDO / REDO
     # ──────────────────────────────────────────
 
-    def _push_undo(self):
-        snap = ([row[:] for row in self.terrain],
-                [row[:] for row in self.rotations],
+    # Undo entries are tagged tuples:
+    #   ("snap", terrain, rotations, checkpoint_zones, circuit_direction,
+    #    powerup_zones)                    full editor state
+    #   ("delta", cells, terrain_vals, rotations_vals, rect)
+    #                                      one paint/erase stroke: flat
+    #                                      indices of the cells it changed,
+    #                                      their old values, and the block
+    #                                      (r0, c0, r1, c1) they lie in
+
+    def _snapshot(self):
+        return ("snap",
+                self.terrain.copy(),
+                self.rotations.copy(),
                 [z[:] for z in self.checkpoint_zones],
                 list(self.circuit_direction) if self.circuit_direction else None,
                 [z[:] for z in self.powerup_zones])
-        self.undo_stack.append(snap)
-        if len(self.undo_stack) > MAX_UNDO:
-            self.undo_stack.pop(0)
+
+    def _push_entry(self, entry):
+        self.undo_stack.append(entry)
         self.redo_stack.clear()
+        # Every zone/direction/terrain edit pushes an entry first, so this
+        # is where the cached viewport learns about edits that don't go
+        # through _invalidate_chunks
+        self._viewport_dirty = True
+
+    def _push_undo(self):
+        self._end_stroke()
+        self._push_entry(self._snapshot())
+
+    def _push_undo_replacing(self):
+        """Like _push_undo, for callers about to replace the grids and zone
+        lists wholesale (new/load): the live objects become the undo entry
+        as they are, without copying."""
+        self._end_stroke()
+        self._push_entry(("snap", self.terrain, self.rotations,
+                          self.checkpoint_zones, self.circuit_direction,
+                          self.powerup_zones))
+
+    def _restore(self, entry):
+        """Apply an undo/redo entry and return the entry that reverts it."""
+        if entry[0] == "delta":
+            _, cells, t_vals, r_vals, rect = entry
+            inverse = ("delta", cells, self.terrain.flat[cells],
+                       self.rotations.flat[cells], rect)
+            self.terrain.flat[cells] = t_vals
+            self.rotations.flat[cells] = r_vals
+            self._invalidate_chunks(rect)
+            return inverse
+        # Swap: the live arrays/lists are being replaced, so the inverse
+        # entry can take them over without copying
+        inverse = ("snap", self.terrain, self.rotations,
+                   self.checkpoint_zones, self.circuit_direction,
+                   self.powerup_zones)
+        (_, self.terrain, self.rotations, self.checkpoint_zones,
+         self.circuit_direction, self.powerup_zones) = entry
+        self._invalidate_chunks()
+        return inverse
 
     def _undo(self):
+        self._end_stroke()
         if not self.undo_stack:
             return
-        self.redo_stack.append(([row[:] for row in self.terrain],
-                                [row[:] for row in self.rotations],
-                                [z[:] for z in self.checkpoint_zones],
-                                list(self.circuit_direction) if self.circuit_direction else None,
-                                [z[:] for z in self.powerup_zones]))
-        snap = self.undo_stack.pop()
-        self.terrain = snap[0]
-        self.rotations = snap[1]
-        self.checkpoint_zones = snap[2] if len(snap) > 2 else []
-        self.circuit_direction = snap[3] if len(snap) > 3 else None
-        self.powerup_zones = snap[4] if len(snap) > 4 else []
+        self.redo_stack.append(self._restore(self.undo_stack.pop()))
 
     def _redo(self):
+        self._end_stroke()
         if not self.redo_stack:
             return
-        self.undo_stack.append(([row[:] for row in self.terrain],
-                                [row[:] for row in self.rotations],
-                                [z[:] for z in self.checkpoint_zones],
-                                list(self.circuit_direction) if self.circuit_direction else None,
-                                [z[:] for z in self.powerup_zones]))
-        snap = self.redo_stack.pop()
-        self.terrain = snap[0]
-        self.rotations = snap[1]
-        self.checkpoint_zones = snap[2] if len(snap) > 2 else []
-        self.circuit_direction = snap[3] if len(snap) > 3 else None
-        self.powerup_zones = snap[4] if len(snap) > 4 else []
+        self.undo_stack.append(self._restore(self.redo_stack.pop()))
+
+    # ── Strokes (press -> drag -> release = one undo step) ──
+
+    def _begin_stroke(self):
+        self._end_stroke()
+        np.copyto(self._stroke_terrain, self.terrain)
+        np.copyto(self._stroke_rotations, self.rotations)
+        self._stroke_open = True
+        self._stroke_cell = None
+
+    def _stroke_to(self, row, col, erase=False):
+        """Stamp every cell from the previous drag position to (row, col),
+        so fast drags that skip cells between motion events leave no gaps."""
+        last = self._stroke_cell
+        if last == (row, col):
+            return  # still inside the cell stamped last time
+        self._stroke_cell = (row, col)
+        if last is None:
+            self._stroke_at(row, col, erase)
+            return
+        for r, c in tile_line(last[0], last[1], row, col)[1:]:
+            self._stroke_at(r, c, erase)
+
+    def _stroke_at(self, row, col, erase=False):
+        """Paint/erase at (row, col) as part of the current stroke."""
+        if erase:
+            dirty = self._erase_at(row, col)
+        else:
+            dirty = self._paint_at(row, col)
+        if dirty is not None:
+            self._invalidate_chunks(dirty)
+
+    def _end_stroke(self):
+        """Turn the cells the current stroke changed into one undo entry."""
+        if not self._stroke_open:
+            return
+        self._stroke_open = False
+        changed = ((self._stroke_terrain != self.terrain)
+                   | (self._stroke_rotations != self.rotations))
+        rows, cols = np.nonzero(changed)
+        if not len(rows):
+            return  # repainted what was already there: nothing to undo
+        cells = rows * GRID_COLS + cols
+        rect = (int(rows.min()), int(cols.min()),
+                int(rows.max()) + 1, int(cols.max()) + 1)
+        self._push_entry(("delta", cells, self._stroke_terrain[changed],
+                          self._stroke_rotations[changed], rect))
 
     # ──────────────────────────────────────────
     # PAINTING
     # ──────────────────────────────────────────
 
     def _paint_at(self, row, col):
-        """Paint current brush at grid position."""
+        """Paint current brush at grid position.
+
+        Returns the touched block as (r0, c0, r1, c1), or None.
+        """
         if self.selected_tile == T_EMPTY:
             # Eraser mode with brush size
-            w, h = self.current_brush.width, self.current_brush.height
-            for dr in range(h):
-                for dc in range(w):
-                    r, c = row + dr, col + dc
-                    if 0 <= r < GRID_ROWS and 0 <= c < GRID_COLS:
-                        self.terrain[r][c] = T_EMPTY
-                        self.rotations[r][c] = 0
-        else:
-            self.current_brush.paint_at(
-                self.terrain, row, col,
-                rotations_grid=self.rotations,
-                rotation_offset=self.current_rotation)
+            return self._clear_rect(row, col, self.current_brush.width,
+                                    self.current_brush.height)
+        return self.current_brush.paint_at(
+            self.terrain, row, col,
+            rotations_grid=self.rotations,
+            rotation_offset=self.current_rotation)
 
     def _erase_at(self, row, col):
-        w = max(1, self.current_brush.width)
-        h = max(1, self.current_brush.height)
-        for dr in range(h):
-            for dc in range(w):
-                r, c = row + dr, col + dc
-                if 0 <= r < GRID_ROWS and 0 <= c < GRID_COLS:
-                    self.terrain[r][c] = T_EMPTY
-                    self.rotations[r][c] = 0
+        return self._clear_rect(row, col, max(1, self.current_brush.width),
+                                max(1, self.current_brush.height))
+
+    def _clear_rect(self, row, col, w, h):
+        """Reset a w x h block at (row, col) to grass, clipped to the grid.
+
+        Returns the touched block as (r0, c0, r1, c1), or None when
+        nothing changed (outside the grid, or a cell that is grass already).
+        """
+        if w == 1 and h == 1:
+            if not (0 <= row < GRID_ROWS and 0 <= col < GRID_COLS):
+                return None
+            if (self.terrain[row, col] == T_EMPTY
+                    and self.rotations[row, col] == 0):
+                return None  # erasing over grass: nothing to redraw
+            self.terrain[row, col] = T_EMPTY
+            self.rotations[row, col] = 0
+            return row, col, row + 1, col + 1
+        r0, r1 = max(0, row), min(GRID_ROWS, row + h)
+        c0, c1 = max(0, col), min(GRID_COLS, col + w)
+        if r0 >= r1 or c0 >= c1:
+            return None
+        self.terrain[r0:r1, c0:c1] = T_EMPTY
+        self.rotations[r0:r1, c0:c1] = 0
+        return r0, c0, r1, c1
 
     # ──────────────────────────────────────────
     # FIT VIEW / STATUS
@@ -327,16 +591,26 @@ class TileEditor:
     # VALIDATION
     # ──────────────────────────────────────────
 
+    def _get_driveable_lut(self):
+        """Bool array indexed by tile ID, rebuilt when tile metadata changes."""
+        mgr = get_manager()
+        revision, lut = self._driveable_lut
+        if lut is None or revision != mgr.revision:
+            tile_ids = mgr.all_tile_ids()  # also loads metadata on first use
+            size = max(tile_ids, default=T_FINISH) + 1
+            lut = np.fromiter((is_driveable(tid) for tid in range(size)),
+                              dtype=bool, count=size)
+            self._driveable_lut = (mgr.revision, lut)
+        return lut
+
     def _has_circuit(self):
-        count = 0
-        has_finish = False
-        for row in self.terrain:
-            for t in row:
-                if is_driveable(t):
-                    count += 1
-                if t == T_FINISH:
-                    has_finish = True
-        return has_finish and count >= 10
+        # One linear pass counts every tile ID, then the driveable table
+        # picks out the counts to sum (IDs past its end are unknown tiles)
+        lut = self._get_driveable_lut()
+        counts = np.bincount(self.terrain.ravel(), minlength=len(lut))
+        if not counts[T_FINISH]:
+            return False
+        return int(counts[:len(lut)][lut].sum()) >= 10
 
     def _build_tile_data(self):
         data = {
@@ -346,12 +620,11 @@ class TileEditor:
             "tile_size": TILE_SIZE,
             "grid_width": GRID_COLS,
             "grid_height": GRID_ROWS,
-            "terrain": [row[:] for row in self.terrain],
+            "terrain": self.terrain.tolist(),
         }
-        has_rotations = any(
-            r != 0 for row in self.rotations for r in row)
-        if has_rotations:
-            data["rotations"] = [row[:] for row in self.rotations]
+        rotations = self._rotations_for_save()
+        if rotations is not None:
+            data["rotations"] = rotations
             data["version"] = 4
         if self.checkpoint_zones:
             data["checkpoint_zones"] = [z[:] for z in self.checkpoint_zones]
@@ -361,6 +634,11 @@ class TileEditor:
             data["powerup_zones"] = [z[:] for z in self.powerup_zones]
         return data
 
+    def _rotations_for_save(self):
+        """Rotation grid as nested lists, or None when nothing is rotated
+        (the file then stays at version 3 without a rotations field)."""
+        return self.rotations.tolist() if self.rotations.any() else None
+
     # ──────────────────────────────────────────
     # DIALOGS
     # ──────────────────────────────────────────
@@ -373,6 +651,7 @@ class TileEditor:
         self.dialog_mode = "load"
         self.dialog_tracks = track_manager.list_tracks()
         self.dialog_selected = 0
+        self._track_rows.clear()
 
     def _close_dialog(self):
         self.dialog_mode = None
@@ -386,8 +665,8 @@ class TileEditor:
         filename = name.lower().replace(" ", "_")
         try:
             track_manager.save_tile_track(
-                filename, name, self.terrain,
-                rotations=self.rotations,
+                filename, name, self.terrain.tolist(),
+                rotations=self._rotations_for_save(),
                 checkpoint_zones=self.checkpoint_zones or None,
                 circuit_direction=self.circuit_direction,
                 powerup_zones=self.powerup_zones or None)
@@ -407,11 +686,15 @@ class TileEditor:
             if data.get("format") != "tiles":
                 self._show_msg("Classic track - not tile-based")
                 return
-            self._push_undo()
-            self.terrain = data["terrain"]
-            self.rotations = data.get("rotations", None)
-            if self.rotations is None:
-                self.rotations = empty_rotations()
+            terrain = np.array(data["terrain"], dtype=TERRAIN_DTYPE)
+            rotations = data.get("rotations", None)
+            if rotations is None:
+                rotations = new_rotations()
+            else:
+                rotations = np.array(rotations, dtype=ROTATION_DTYPE)
+            self._push_undo_replacing()
+            self.terrain, self.rotations = terrain, rotations
+            self._invalidate_chunks()
             self.checkpoint_zones = [
                 z[:] for z in data.get("checkpoint_zones", [])]
             self.circuit_direction = data.get("circuit_direction", None)
@@ -432,11 +715,15 @@ class TileEditor:
             if data.get("format") != "tiles":
                 self._show_msg("Classic track - not tile-based")
                 return False
-            self._push_undo()
-            self.terrain = data["terrain"]
-            self.rotations = data.get("rotations", None)
-            if self.rotations is None:
-                self.rotations = empty_rotations()
+            terrain = np.array(data["terrain"], dtype=TERRAIN_DTYPE)
+            rotations = data.get("rotations", None)
+            if rotations is None:
+                rotations = new_rotations()
+            else:
+                rotations = np.array(rotations, dtype=ROTATION_DTYPE)
+            self._push_undo_replacing()
+            self.terrain, self.rotations = terrain, rotations
+            self._invalidate_chunks()
             self.checkpoint_zones = [
                 z[:] for z in data.get("checkpoint_zones", [])]
             self.circuit_direction = data.get("circuit_direction", None)
@@ -457,8 +744,8 @@ class TileEditor:
                 track_manager.save_tile_track(
                     self.current_filename,
                     self.current_name or self.current_filename,
-                    self.terrain,
-                    rotations=self.rotations,
+                    self.terrain.tolist(),
+                    rotations=self._rotations_for_save(),
                     checkpoint_zones=self.checkpoint_zones or None,
                     circuit_direction=self.circuit_direction,
                     powerup_zones=self.powerup_zones or None)
@@ -473,8 +760,22 @@ class TileEditor:
     # ──────────────────────────────────────────
 
     def handle_event(self, event):
+        # Cursor and space state are tracked before any modal UI can
+        # swallow the event
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                          pygame.MOUSEBUTTONUP):
+            self._mouse_pos = event.pos
+            for panel in self._panels:
+                panel.mouse_pos = event.pos
+        elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            if event.key == pygame.K_SPACE:
+                self._space_held = event.type == pygame.KEYDOWN
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self._space_held = False
+
         # Collision editor captures all events when active
         if self._collision_editor is not None:
+            self._collision_editor.mouse_pos = self._mouse_pos
             result = self._collision_editor.handle_event(event)
             if self._collision_editor.done:
                 self._collision_editor = None
@@ -523,7 +824,7 @@ class TileEditor:
         return True
 
     def _handle_keydown(self, event):
-        mods = pygame.key.get_mods()
+        mods = event.mod  # modifier state SDL captured with the key press
         ctrl = mods & pygame.KMOD_CTRL
         shift = mods & pygame.KMOD_SHIFT
 
@@ -546,6 +847,7 @@ class TileEditor:
                 self.cp_drag_current = None
                 self._show_msg("Checkpoint mode OFF")
                 return True
+            get_manager().flush()
             self.result = "menu"
             return True
 
@@ -562,9 +864,10 @@ class TileEditor:
             self._open_load_dialog()
             return True
         if ctrl and event.key == pygame.K_n:
-            self._push_undo()
-            self.terrain = empty_terrain()
-            self.rotations = empty_rotations()
+            self._push_undo_replacing()
+            self.terrain = new_terrain()
+            self.rotations = new_rotations()
+            self._invalidate_chunks()
             self.current_rotation = 0
             self.checkpoint_zones = []
             self.circuit_direction = None
@@ -591,6 +894,7 @@ class TileEditor:
 
         if event.key == pygame.K_t:
             if self._has_circuit():
+                get_manager().flush()
                 self.result = "test"
             else:
                 self._show_msg("Need finish + circuit (10+ driveable)")
@@ -669,8 +973,7 @@ class TileEditor:
         if not self._is_in_viewport(sx, sy):
             return True
 
-        keys = pygame.key.get_pressed()
-        if event.button == 2 or (event.button == 1 and keys[pygame.K_SPACE]):
+        if event.button == 2 or (event.button == 1 and self._space_held):
             self.panning = True
             self.pan_start = (sx, sy)
             self.pan_cam_start = (self.cam_x, self.cam_y)
@@ -689,13 +992,11 @@ class TileEditor:
             if event.button == 3:
                 wx, wy = self.screen_to_world(sx, sy)
                 # Find and delete zone under cursor
-                for i, z in enumerate(self.powerup_zones):
-                    r = pygame.Rect(z[0], z[1], z[2], z[3])
-                    if r.collidepoint(wx, wy):
-                        self._push_undo()
-                        self.powerup_zones.pop(i)
-                        self._show_msg(f"Deleted power-up zone {i}")
-                        break
+                i = self._zone_at(self.powerup_zones, wx, wy)
+                if i >= 0:
+                    self._push_undo()
+                    self.powerup_zones.pop(i)
+                    self._show_msg(f"Deleted power-up zone {i}")
                 return True
             return True
 
@@ -727,34 +1028,41 @@ class TileEditor:
             if event.button == 3:
                 wx, wy = self.screen_to_world(sx, sy)
                 # Find and delete zone under cursor
-                for i, z in enumerate(self.checkpoint_zones):
-                    r = pygame.Rect(z[0], z[1], z[2], z[3])
-                    if r.collidepoint(wx, wy):
-                        self._push_undo()
-                        self.checkpoint_zones.pop(i)
-                        self._show_msg(f"Deleted checkpoint {i}")
-                        break
+                i = self._zone_at(self.checkpoint_zones, wx, wy)
+                if i >= 0:
+                    self._push_undo()
+                    self.checkpoint_zones.pop(i)
+                    self._show_msg(f"Deleted checkpoint {i}")
                 return True
             return True
 
         if event.button == 1:
             row, col = self.screen_to_tile(sx, sy)
             if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                self._push_undo()
+                self._begin_stroke()
                 self.painting = True
-                self._paint_at(row, col)
+                self._stroke_to(row, col)
             return True
 
         if event.button == 3:
             row, col = self.screen_to_tile(sx, sy)
             if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                self._push_undo()
+                self._begin_stroke()
                 self.erasing = True
-                self._erase_at(row, col)
+                self._stroke_to(row, col, erase=True)
             return True
 
         return True
 
+    @staticmethod
+    def _zone_from_drag(start, wx, wy):
+        """[x, y, w, h] spanned by a drag from start to the snapped end
+        (wx, wy), normalized to positive size and at least one tile."""
+        x0, y0 = start
+        return [int(min(x0, wx)), int(min(y0, wy)),
+                int(max(abs(wx - x0), TILE_SIZE)),
+                int(max(abs(wy - y0), TILE_SIZE))]
+
     def _handle_mouseup(self, event):
         if event.button == 2 or (event.button == 1 and self.panning):
             self.panning = False
@@ -766,20 +1074,9 @@ class TileEditor:
             # Snap end to grid
             wx = int(wx // TILE_SIZE) * TILE_SIZE + TILE_SIZE
             wy = int(wy // TILE_SIZE) * TILE_SIZE + TILE_SIZE
-            x0, y0 = self.pu_drag_start
-            # Normalize (ensure positive w/h)
-            x1 = min(x0, wx)
-            y1 = min(y0, wy)
-            x2 = max(x0, wx)
-            y2 = max(y0, wy)
-            # Minimum 1 tile size
-            if x2 - x1 < TILE_SIZE:
-                x2 = x1 + TILE_SIZE
-            if y2 - y1 < TILE_SIZE:
-                y2 = y1 + TILE_SIZE
             self._push_undo()
-            self.powerup_zones.append([int(x1), int(y1),
-                                       int(x2 - x1), int(y2 - y1)])
+            self.powerup_zones.append(
+                self._zone_from_drag(self.pu_drag_start, wx, wy))
             self.pu_drag_start = None
             self.pu_drag_current = None
             self._show_msg(f"Power-up zone P{len(self.powerup_zones) - 1} placed")
@@ -790,8 +1087,8 @@ class TileEditor:
             sx, sy = event.pos
             wx, wy = self.screen_to_world(sx, sy)
             x1, y1 = self.dir_drag_start
-            dist = ((wx - x1) ** 2 + (wy - y1) ** 2) ** 0.5
-            if dist >= TILE_SIZE:
+            dx, dy = wx - x1, wy - y1
+            if dx * dx + dy * dy >= TILE_SIZE * TILE_SIZE:
                 self._push_undo()
                 self.circuit_direction = [x1, y1, wx, wy]
                 self._show_msg("Direction arrow set")
@@ -808,32 +1105,25 @@ class TileEditor:
             # Snap end to grid
             wx = int(wx // TILE_SIZE) * TILE_SIZE + TILE_SIZE
             wy = int(wy // TILE_SIZE) * TILE_SIZE + TILE_SIZE
-            x0, y0 = self.cp_drag_start
-            # Normalize (ensure positive w/h)
-            x1 = min(x0, wx)
-            y1 = min(y0, wy)
-            x2 = max(x0, wx)
-            y2 = max(y0, wy)
-            # Minimum 1 tile size
-            if x2 - x1 < TILE_SIZE:
-                x2 = x1 + TILE_SIZE
-            if y2 - y1 < TILE_SIZE:
-                y2 = y1 + TILE_SIZE
             self._push_undo()
-            self.checkpoint_zones.append([int(x1), int(y1),
-                                          int(x2 - x1), int(y2 - y1)])
+            self.checkpoint_zones.append(
+                self._zone_from_drag(self.cp_drag_start, wx, wy))
             self.cp_drag_start = None
             self.cp_drag_current = None
             self._show_msg(f"Checkpoint {len(self.checkpoint_zones) - 1} placed")
             return True
 
         if event.button == 1:
+            if self.painting:
+                self._end_stroke()
             self.painting = False
             # Also notify browser of mouse up for selection
             self.browser_panel.handle_event(event)
         if event.button in (2, 3):
             self.browser_panel.handle_event(event)
         if event.button == 3:
+            if self.erasing:
+                self._end_stroke()
             self.erasing = False
         return True
 
@@ -874,24 +1164,20 @@ class TileEditor:
             self.cam_y = self.pan_cam_start[1] - dy / self.zoom
             return True
 
-        # Painting
-        if self.painting and self._is_in_viewport(sx, sy):
+        # Painting / erasing (the gap fill restarts after leaving the grid)
+        if self.painting or self.erasing:
             row, col = self.screen_to_tile(sx, sy)
-            if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                self._paint_at(row, col)
-            return True
-
-        # Erasing
-        if self.erasing and self._is_in_viewport(sx, sy):
-            row, col = self.screen_to_tile(sx, sy)
-            if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                self._erase_at(row, col)
+            if (self._is_in_viewport(sx, sy)
+                    and 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS):
+                self._stroke_to(row, col, erase=not self.painting)
+            else:
+                self._stroke_cell = None
             return True
 
         return True
 
     def _handle_mousewheel(self, event):
-        mx, my = pygame.mouse.get_pos()
+        mx, my = self._mouse_pos
 
         # Browser zoom
         if self.browser_panel.contains(mx, my):
@@ -918,6 +1204,8 @@ class TileEditor:
             self.status_timer -= dt
             if self.status_timer <= 0:
                 self.status_msg = ""
+        # Metadata edits are saved once they've settled
+        get_manager().flush(SAVE_DELAY)
 
     # ──────────────────────────────────────────
     # RENDER
@@ -947,6 +1235,25 @@ class TileEditor:
     # ──────────────────────────────────────────
 
     def _draw_viewport(self):
+        # The editor is static between inputs: reuse the last frame's
+        # viewport unless an event, an edit or the camera changed it
+        key = (self.zoom, self.cam_x, self.cam_y)
+        if not self._viewport_dirty and key == self._viewport_key:
+            self.screen.blit(self._viewport_cache, (0, 0))
+        else:
+            self._render_viewport()
+            self._viewport_cache.blit(
+                self.screen, (0, 0), (0, 0, SCREEN_WIDTH, VIEWPORT_HEIGHT))
+            self._viewport_key = key
+            self._viewport_dirty = False
+        # Drag and hover previews follow the cursor, so they stay out of
+        # the cache
+        self.screen.set_clip(pygame.Rect(0, 0, SCREEN_WIDTH, VIEWPORT_HEIGHT))
+        self._draw_drag_previews()
+        self._draw_hover_preview()
+        self.screen.set_clip(None)
+
+    def _render_viewport(self):
         viewport_rect = pygame.Rect(0, 0, SCREEN_WIDTH, VIEWPORT_HEIGHT)
         self.screen.set_clip(viewport_rect)
         self.screen.fill(GRASS_DARK, viewport_rect)
@@ -954,46 +1261,43 @@ class TileEditor:
         # Visible tile range
         w0x, w0y = self.screen_to_world(0, 0)
         w1x, w1y = self.screen_to_world(SCREEN_WIDTH, VIEWPORT_HEIGHT)
-        start_col = max(0, int(w0x // TILE_SIZE))
-        start_row = max(0, int(w0y // TILE_SIZE))
-        end_col = min(GRID_COLS, int(w1x // TILE_SIZE) + 2)
-        end_row = min(GRID_ROWS, int(w1y // TILE_SIZE) + 2)
+        start_col = max(0, math.floor(w0x) >> LOG2_TILE_SIZE)
+        start_row = max(0, math.floor(w0y) >> LOG2_TILE_SIZE)
+        end_col = min(GRID_COLS, (math.floor(w1x) >> LOG2_TILE_SIZE) + 2)
+        end_row = min(GRID_ROWS, (math.floor(w1y) >> LOG2_TILE_SIZE) + 2)
 
         tile_screen_size = max(1, int(TILE_SIZE * self.zoom))
 
-        # Cache scaled sprites
-        scaled_cache = {}
-
-        def get_scaled(sprite, key):
-            if key in scaled_cache:
-                return scaled_cache[key]
-            if tile_screen_size != TILE_SIZE:
-                s = pygame.transform.scale(
-                    sprite, (tile_screen_size + 1, tile_screen_size + 1))
-            else:
-                s = sprite
-            scaled_cache[key] = s
-            return s
-
-        scaled_grass = get_scaled(self._grass_sprite, "grass")
+        # Scaled sprites persist across frames until the tile size changes
+        if tile_screen_size != self._scaled_cache_size:
+            self._scaled_cache.clear()
+            self._scaled_cache_size = tile_screen_size
 
-        # Draw tiles
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                tid = self.terrain[row][col]
-                sx, sy = self.world_to_screen(col * TILE_SIZE, row * TILE_SIZE)
-                isx, isy = int(sx), int(sy)
-
-                if tid == T_EMPTY:
-                    self.screen.blit(scaled_grass, (isx, isy))
-                else:
-                    rot = self.rotations[row][col]
-                    sprite = get_tile_sprite(tid, rot)
-                    if sprite is not None:
-                        self.screen.blit(
-                            get_scaled(sprite, (tid, rot)), (isx, isy))
-                    else:
-                        self.screen.blit(scaled_grass, (isx, isy))
+        step, off_x, off_y = self.tile_transform()
+        if tile_screen_size <= PALETTE_MAX_TILE_PX:
+            # Terrain at tiny zoom: sprites would be a few pixels anyway
+            self._draw_terrain_palette(off_x, off_y)
+        else:
+            # Terrain (pre-rendered chunks, scaled once per zoom level)
+            if self.zoom != self._chunk_scaled_zoom:
+                self._chunk_scaled.clear()
+                self._chunk_scaled_zoom = self.zoom
+            chunk_step = CHUNK_TILES * step
+            visible = set()
+            blit_seq = []
+            for cr in range(start_row // CHUNK_TILES,
+                            (end_row - 1) // CHUNK_TILES + 1):
+                csy = math.floor(cr * chunk_step + off_y)
+                for cc in range(start_col // CHUNK_TILES,
+                                (end_col - 1) // CHUNK_TILES + 1):
+                    key = (cr, cc)
+                    visible.add(key)
+                    csx = math.floor(cc * chunk_step + off_x)
+                    blit_seq.append((self._get_chunk(key), (csx, csy)))
+            self.screen.blits(blit_seq, doreturn=False)
+            # Only keep scaled copies of what is on screen (bounded memory)
+            for key in [k for k in self._chunk_scaled if k not in visible]:
+                del self._chunk_scaled[key]
 
         # Grid lines
         if self.zoom > 0.2:
@@ -1015,116 +1319,250 @@ class TileEditor:
         # Circuit direction arrow
         self._draw_circuit_direction()
 
-        # Hover preview (show brush outline with rotated sprite preview)
-        mx, my = pygame.mouse.get_pos()
-        if self._is_in_viewport(mx, my) and not self.panning:
-            row, col = self.screen_to_tile(mx, my)
-            if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                bw = self.current_brush.width
-                bh = self.current_brush.height
-                for dr in range(bh):
-                    for dc in range(bw):
-                        r = row + dr
-                        c = col + dc
-                        if 0 <= r < GRID_ROWS and 0 <= c < GRID_COLS:
-                            bsx, bsy = self.world_to_screen(
-                                c * TILE_SIZE, r * TILE_SIZE)
-                            ibsx, ibsy = int(bsx), int(bsy)
-                            # Show rotated tile preview
-                            tid = self.current_brush.tiles[dr][dc]
-                            if tid != T_EMPTY and self.selected_tile != T_EMPTY:
-                                brot = (self.current_brush.rotations[dr][dc]
-                                        + self.current_rotation) % 4
-                                preview_spr = get_tile_sprite(tid, brot)
-                                if preview_spr is not None:
-                                    ps = get_scaled(
-                                        preview_spr, (tid, brot, "preview"))
-                                    ps.set_alpha(120)
-                                    self.screen.blit(ps, (ibsx, ibsy))
-                                    ps.set_alpha(255)
-                            else:
-                                hover = pygame.Surface(
-                                    (tile_screen_size, tile_screen_size),
-                                    pygame.SRCALPHA)
-                                hover.fill((255, 255, 100, 50))
-                                self.screen.blit(hover, (ibsx, ibsy))
-                            pygame.draw.rect(self.screen, (255, 255, 100),
-                                             (ibsx, ibsy,
-                                              tile_screen_size,
-                                              tile_screen_size), 1)
-
         self.screen.set_clip(None)
 
+    def _draw_hover_preview(self):
+        """Brush outline with rotated sprite preview under the cursor."""
+        cell = self._hover_cell()
+        if cell is None or self.panning:
+            return
+        row, col = cell
+        if not (0 <= row < GRID_ROWS and 0 <= col < GRID_COLS):
+            return
+        step, off_x, off_y = self.tile_transform()
+        tile_screen_size = self._scaled_cache_size
+        bw = self.current_brush.width
+        bh = self.current_brush.height
+        hover_fill = self._scaled_cache.get("hover")
+        if hover_fill is None:
+            hover_fill = self._tint_surface(
+                (tile_screen_size, tile_screen_size), (255, 255, 100, 50))
+            self._scaled_cache["hover"] = hover_fill
+        tiles = self.current_brush.tiles
+        rotations = self.current_brush.rotations
+        show_tiles = self.selected_tile != T_EMPTY
+        if bw == 1 and bh == 1:
+            # Single tile, the common case: no lists, no loops
+            ibsx = int(col * step + off_x)
+            ibsy = int(row * step + off_y)
+            ps = hover_fill
+            if tiles[0][0] != T_EMPTY and show_tiles:
+                ps = self._get_preview(
+                    tiles[0][0], (rotations[0][0] + self.current_rotation) % 4)
+            if ps is not None:
+                self.screen.blit(ps, (ibsx, ibsy))
+            pygame.draw.rect(self.screen, (255, 255, 100),
+                             (ibsx, ibsy, tile_screen_size, tile_screen_size), 1)
+            return
+        # Only the part of the brush that lies on the grid; sprites go out
+        # in one blits() call, outlines on top of them
+        blit_seq = []
+        outlines = []
+        # Screen x per brush column and y per brush row, computed once
+        # rather than per cell; int() of the same float keeps them on the
+        # grid the viewport drew
+        xs = [int((col + dc) * step + off_x)
+              for dc in range(min(bw, GRID_COLS - col))]
+        ys = [int((row + dr) * step + off_y)
+              for dr in range(min(bh, GRID_ROWS - row))]
+        for dr, ibsy in enumerate(ys):
+            trow = tiles[dr]
+            rrow = rotations[dr]
+            for dc, ibsx in enumerate(xs):
+                # Show rotated tile preview
+                tid = trow[dc]
+                if tid != T_EMPTY and show_tiles:
+                    brot = (rrow[dc] + self.current_rotation) % 4
+                    ps = self._get_preview(tid, brot)
+                    if ps is not None:
+                        blit_seq.append((ps, (ibsx, ibsy)))
+                else:
+                    blit_seq.append((hover_fill, (ibsx, ibsy)))
+                outlines.append((ibsx, ibsy, tile_screen_size, tile_screen_size))
+        self.screen.blits(blit_seq, doreturn=False)
+        for r in outlines:
+            pygame.draw.rect(self.screen, (255, 255, 100), r, 1)
+
+    def _invalidate_chunks(self, rect=None):
+        """Mark terrain chunks stale; rect is (r0, c0, r1, c1) or None = all."""
+        self._palette_surf = None
+        self._viewport_dirty = True
+        if rect is None:
+            self._chunks.clear()
+            self._chunk_scaled.clear()
+            self._dirty_chunks.clear()
+            return
+        r0, c0, r1, c1 = rect
+        for cr in range(r0 // CHUNK_TILES, (r1 - 1) // CHUNK_TILES + 1):
+            for cc in range(c0 // CHUNK_TILES, (c1 - 1) // CHUNK_TILES + 1):
+                # Grow the chunk's stale block to cover this edit too
+                old = self._dirty_chunks.get((cr, cc))
+                self._dirty_chunks[(cr, cc)] = rect if old is None else (
+                    min(old[0], r0), min(old[1], c0),
+                    max(old[2], r1), max(old[3], c1))
+
+    def _get_chunk(self, key):
+        """Return terrain chunk `key` scaled to the current zoom."""
+        stale = self._dirty_chunks.pop(key, None)
+        if stale is not None or key not in self._chunks:
+            self._chunks[key] = self._render_chunk(*key, cells=stale)
+            self._chunk_scaled.pop(key, None)
+        scaled = self._chunk_scaled.get(key)
+        if scaled is None:
+            chunk = self._chunks[key]
+            w, h = chunk.get_size()
+            sw = max(1, math.ceil(w * self.zoom))
+            sh = max(1, math.ceil(h * self.zoom))
+            if (sw, sh) == (w, h):
+                scaled = chunk
+            else:
+                scaled = pygame.transform.scale(chunk, (sw, sh))
+            self._chunk_scaled[key] = scaled
+        return scaled
+
+    def _draw_terrain_palette(self, off_x, off_y):
+        """Draw the whole terrain as one scaled image of per-tile colours."""
+        if self._palette_surf is None:
+            ids = np.unique(self.terrain).tolist()
+            lut = np.zeros((ids[-1] + 1, 3), dtype=np.uint8)
+            for tid in ids:
+                lut[tid] = self._tile_color(tid)
+            # lut[terrain] is (rows, cols, 3); surfarray wants (x, y, 3)
+            self._palette_surf = pygame.surfarray.make_surface(
+                lut[self.terrain].swapaxes(0, 1))
+            self._palette_scaled = None
+        if self._palette_scaled is None or self._palette_scaled[0] != self.zoom:
+            size = (math.ceil(GRID_COLS * TILE_SIZE * self.zoom),
+                    math.ceil(GRID_ROWS * TILE_SIZE * self.zoom))
+            self._palette_scaled = (
+                self.zoom, pygame.transform.scale(self._palette_surf, size))
+        self.screen.blit(self._palette_scaled[1],
+                         (math.floor(off_x), math.floor(off_y)))
+
+    def _tile_color(self, tid):
+        """Average colour of a tile as drawn over the viewport background."""
+        color = self._tile_colors.get(tid)
+        if color is None:
+            sprite = get_tile_sprite(tid)
+            tile = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            tile.fill(GRASS_DARK)
+            tile.blit(sprite if sprite is not None else self._grass_sprite,
+                      (0, 0))
+            color = tuple(pygame.transform.average_color(tile))[:3]
+            self._tile_colors[tid] = color
+        return color
+
+    def _render_chunk(self, cr, cc, cells=None):
+        """Draw one chunk of the terrain at world resolution.
+
+        With `cells` (r0, c0, r1, c1), only that block is redrawn into the
+        chunk's existing surface (paint strokes touch a few cells).
+        """
+        r0, c0 = cr * CHUNK_TILES, cc * CHUNK_TILES
+        r1 = min(GRID_ROWS, r0 + CHUNK_TILES)
+        c1 = min(GRID_COLS, c0 + CHUNK_TILES)
+        surf = self._chunks.get((cr, cc)) if cells is not None else None
+        if surf is None:
+            surf = pygame.Surface(
+                ((c1 - c0) * TILE_SIZE, (r1 - r0) * TILE_SIZE), 0, self.screen)
+            dr0, dc0, dr1, dc1 = r0, c0, r1, c1
+        else:
+            dr0, dc0 = max(r0, cells[0]), max(c0, cells[1])
+            dr1, dc1 = min(r1, cells[2]), min(c1, cells[3])
+        ox, oy = (dc0 - c0) * TILE_SIZE, (dr0 - r0) * TILE_SIZE
+        w = dc1 - dc0
+        block = (ox, oy, w * TILE_SIZE, (dr1 - dr0) * TILE_SIZE)
+        terrain = self.terrain[dr0:dr1, dc0:dc1]
+        if not terrain.any():  # T_EMPTY == 0
+            # All grass (most of a track): one blit instead of one per cell
+            surf.blit(self._grass_block, (ox, oy), (0, 0) + block[2:])
+            return surf
+        surf.fill(GRASS_DARK, block)
+        # Look each distinct (tile, rotation) up once, then gather per cell
+        keys, inverse = np.unique(
+            terrain.astype(np.int64) * 4
+            + (self.rotations[dr0:dr1, dc0:dc1] & 3),
+            return_inverse=True)
+        sprites = []
+        for key in keys.tolist():
+            tid, rot = divmod(key, 4)
+            sprite = get_tile_sprite(tid, rot)
+            sprites.append(sprite if sprite is not None else self._grass_sprite)
+        # Cell positions for the whole block in two array ops, row-major
+        # like `inverse`
+        h = dr1 - dr0
+        xs = np.tile(np.arange(w) * TILE_SIZE + ox, h).tolist()
+        ys = np.repeat(np.arange(h) * TILE_SIZE + oy, w).tolist()
+        surf.blits(zip([sprites[i] for i in inverse.ravel().tolist()],
+                       zip(xs, ys)), doreturn=False)
+        return surf
+
+    def _get_scaled(self, sprite, key):
+        """Return `sprite` scaled to the current on-screen tile size."""
+        s = self._scaled_cache.get(key)
+        if s is None:
+            size = self._scaled_cache_size
+            if size != TILE_SIZE:
+                s = pygame.transform.scale(sprite, (size + 1, size + 1))
+            else:
+                s = sprite
+            self._scaled_cache[key] = s
+        return s
+
+    def _get_preview(self, tid, rot):
+        """Translucent copy of a tile at the current on-screen size, for the
+        hover preview (a copy, so the shared sprite's alpha is never touched).
+        """
+        key = (tid, rot, "preview")
+        ps = self._scaled_cache.get(key)
+        if ps is None:
+            sprite = get_tile_sprite(tid, rot)
+            if sprite is None:
+                return None
+            ps = self._get_scaled(sprite, (tid, rot)).copy()
+            ps.set_alpha(120)
+            self._scaled_cache[key] = ps
+        return ps
+
     def _draw_grid_lines(self, start_row, start_col, end_row, end_col):
         alpha = min(50, int(self.zoom * 60))
         if alpha < 8:
             return
-        color = (255, 255, 255, alpha)
-        grid_surf = pygame.Surface(
-            (SCREEN_WIDTH, VIEWPORT_HEIGHT), pygame.SRCALPHA)
-
-        for col in range(start_col, end_col + 1):
-            sx, _ = self.world_to_screen(col * TILE_SIZE, 0)
-            isx = int(sx)
-            if 0 <= isx < SCREEN_WIDTH:
-                pygame.draw.line(grid_surf, color,
-                                 (isx, 0), (isx, VIEWPORT_HEIGHT))
-
-        for row in range(start_row, end_row + 1):
-            _, sy = self.world_to_screen(0, row * TILE_SIZE)
-            isy = int(sy)
-            if 0 <= isy < VIEWPORT_HEIGHT:
-                pygame.draw.line(grid_surf, color,
-                                 (0, isy), (SCREEN_WIDTH, isy))
-
-        self.screen.blit(grid_surf, (0, 0))
+        # 1px translucent strips, rebuilt only when the alpha changes
+        if self._grid_strips is None or self._grid_strips[0] != alpha:
+            rgba = (255, 255, 255, alpha)
+            self._grid_strips = (
+                alpha,
+                self._tint_surface((1, VIEWPORT_HEIGHT), rgba),
+                self._tint_surface((SCREEN_WIDTH, 1), rgba))
+        _, v_strip, h_strip = self._grid_strips
+
+        # Line positions for all visible columns/rows in one array op each
+        # (astype truncates toward zero, like int())
+        step, off_x, off_y = self.tile_transform()
+        xs = (np.arange(start_col, end_col + 1) * step + off_x).astype(np.int32)
+        ys = (np.arange(start_row, end_row + 1) * step + off_y).astype(np.int32)
+        xs = xs[(xs >= 0) & (xs < SCREEN_WIDTH)].tolist()
+        ys = ys[(ys >= 0) & (ys < VIEWPORT_HEIGHT)].tolist()
+        blit_seq = [(v_strip, (x, 0)) for x in xs]
+        blit_seq += [(h_strip, (0, y)) for y in ys]
+        self.screen.blits(blit_seq, doreturn=False)
 
     def _draw_checkpoint_zones(self):
-        """Draw checkpoint zone rectangles and drag preview in the viewport."""
-        # Existing zones
-        for i, z in enumerate(self.checkpoint_zones):
-            x, y, w, h = z
-            sx0, sy0 = self.world_to_screen(x, y)
-            sx1, sy1 = self.world_to_screen(x + w, y + h)
-            sw = int(sx1 - sx0)
-            sh = int(sy1 - sy0)
-            if sw < 2 or sh < 2:
-                continue
-            # Semi-transparent violet fill
-            fill_surf = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            fill_surf.fill((180, 60, 220, 50))
-            self.screen.blit(fill_surf, (int(sx0), int(sy0)))
-            # Border
-            pygame.draw.rect(self.screen, (180, 60, 220),
-                             (int(sx0), int(sy0), sw, sh), 2)
-            # Number label with background
-            label = self.font_small.render(str(i), True, COLOR_WHITE)
-            lw, lh = label.get_size()
-            lcx = int(sx0 + sw / 2 - lw / 2)
-            lcy = int(sy0 + sh / 2 - lh / 2)
-            bg = pygame.Surface((lw + 6, lh + 4), pygame.SRCALPHA)
-            bg.fill((0, 0, 0, 160))
-            self.screen.blit(bg, (lcx - 3, lcy - 2))
-            self.screen.blit(label, (lcx, lcy))
-
-        # Drag preview
-        if self.cp_drag_start and self.cp_drag_current:
-            x0, y0 = self.cp_drag_start
-            x1, y1 = self.cp_drag_current
-            sx0, sy0 = self.world_to_screen(min(x0, x1), min(y0, y1))
-            sx1, sy1 = self.world_to_screen(max(x0, x1), max(y0, y1))
-            sw = max(2, int(sx1 - sx0))
-            sh = max(2, int(sy1 - sy0))
-            preview = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            preview.fill((220, 180, 50, 40))
-            self.screen.blit(preview, (int(sx0), int(sy0)))
-            pygame.draw.rect(self.screen, (220, 180, 50),
-                             (int(sx0), int(sy0), sw, sh), 2)
+        """Draw checkpoint zone rectangles in the viewport."""
+        # Semi-transparent violet, numbered
+        self._draw_zones(self.checkpoint_zones, (180, 60, 220), "{}")
 
     def _draw_powerup_zones(self):
-        """Draw power-up zone rectangles and drag preview in the viewport."""
-        # Existing zones (orange/gold)
-        for i, z in enumerate(self.powerup_zones):
+        """Draw power-up zone rectangles in the viewport."""
+        # Semi-transparent orange/gold, labelled "P0", "P1", etc.
+        self._draw_zones(self.powerup_zones, (255, 200, 40), "P{}")
+
+    def _draw_zones(self, zones, color, label_fmt):
+        """Fill, border and centred label for each on-screen zone."""
+        viewport = self.screen.get_clip()
+        fill = (*color, 50)
+        for i, z in enumerate(zones):
             x, y, w, h = z
             sx0, sy0 = self.world_to_screen(x, y)
             sx1, sy1 = self.world_to_screen(x + w, y + h)
@@ -1132,84 +1570,81 @@ class TileEditor:
             sh = int(sy1 - sy0)
             if sw < 2 or sh < 2:
                 continue
-            # Semi-transparent orange/gold fill
-            fill_surf = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            fill_surf.fill((255, 200, 40, 50))
-            self.screen.blit(fill_surf, (int(sx0), int(sy0)))
-            # Border
-            pygame.draw.rect(self.screen, (255, 200, 40),
-                             (int(sx0), int(sy0), sw, sh), 2)
-            # Label "P0", "P1", etc.
-            label = self.font_small.render(f"P{i}", True, COLOR_WHITE)
+            zone_rect = pygame.Rect(int(sx0), int(sy0), sw, sh)
+            label = self._render_cached(label_fmt.format(i), self.font_small,
+                                        COLOR_WHITE)
             lw, lh = label.get_size()
             lcx = int(sx0 + sw / 2 - lw / 2)
             lcy = int(sy0 + sh / 2 - lh / 2)
-            bg = pygame.Surface((lw + 6, lh + 4), pygame.SRCALPHA)
-            bg.fill((0, 0, 0, 160))
-            self.screen.blit(bg, (lcx - 3, lcy - 2))
+            label_bg = pygame.Rect(lcx - 3, lcy - 2, lw + 6, lh + 4)
+            # Off-screen zones (and their labels) cost nothing to skip
+            if not (viewport.colliderect(zone_rect)
+                    or viewport.colliderect(label_bg)):
+                continue
+            self._blit_tint(zone_rect, fill)
+            pygame.draw.rect(self.screen, color, zone_rect, 2)
+            self._blit_tint(label_bg, (0, 0, 0, 160))
             self.screen.blit(label, (lcx, lcy))
 
-        # Drag preview
-        if self.pu_drag_start and self.pu_drag_current:
-            x0, y0 = self.pu_drag_start
-            x1, y1 = self.pu_drag_current
-            sx0, sy0 = self.world_to_screen(min(x0, x1), min(y0, y1))
-            sx1, sy1 = self.world_to_screen(max(x0, x1), max(y0, y1))
-            sw = max(2, int(sx1 - sx0))
-            sh = max(2, int(sy1 - sy0))
-            preview = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            preview.fill((255, 180, 40, 40))
-            self.screen.blit(preview, (int(sx0), int(sy0)))
-            pygame.draw.rect(self.screen, (255, 180, 40),
-                             (int(sx0), int(sy0), sw, sh), 2)
+    def _draw_arrow(self, x1, y1, x2, y2, color, thickness=3):
+        """Draw an arrow from (x1,y1) to (x2,y2) in screen coords."""
+        pygame.draw.line(self.screen, color,
+                         (int(x1), int(y1)), (int(x2), int(y2)), thickness)
+        # Arrowhead
+        dx = x2 - x1
+        dy = y2 - y1
+        length = math.hypot(dx, dy)
+        if length < 1:
+            return
+        # One scale factor turns the shaft delta into the head's length
+        # vector; its perpendicular at half size is the head's half-width
+        k = min(20, length * 0.3) / length
+        hx, hy = dx * k, dy * k
+        wx, wy = -hy * 0.5, hx * 0.5
+        base_x, base_y = x2 - hx, y2 - hy
+        points = [
+            (int(x2), int(y2)),
+            (int(base_x + wx), int(base_y + wy)),
+            (int(base_x - wx), int(base_y - wy)),
+        ]
+        pygame.draw.polygon(self.screen, color, points)
 
     def _draw_circuit_direction(self):
-        """Draw the circuit direction arrow (saved or drag preview)."""
-        import math
-
-        def _draw_arrow(x1, y1, x2, y2, color, thickness=3):
-            """Draw an arrow from (x1,y1) to (x2,y2) in screen coords."""
-            pygame.draw.line(self.screen, color,
-                             (int(x1), int(y1)), (int(x2), int(y2)), thickness)
-            # Arrowhead
-            dx = x2 - x1
-            dy = y2 - y1
-            length = math.hypot(dx, dy)
-            if length < 1:
-                return
-            ux, uy = dx / length, dy / length
-            # Perpendicular
-            px, py = -uy, ux
-            head_len = min(20, length * 0.3)
-            head_w = head_len * 0.5
-            tip_x, tip_y = x2, y2
-            base_x = x2 - ux * head_len
-            base_y = y2 - uy * head_len
-            points = [
-                (int(tip_x), int(tip_y)),
-                (int(base_x + px * head_w), int(base_y + py * head_w)),
-                (int(base_x - px * head_w), int(base_y - py * head_w)),
-            ]
-            pygame.draw.polygon(self.screen, color, points)
-
-        # Saved direction arrow (green)
+        """Draw the saved circuit direction arrow."""
         if self.circuit_direction:
             wx1, wy1, wx2, wy2 = self.circuit_direction
             sx1, sy1 = self.world_to_screen(wx1, wy1)
             sx2, sy2 = self.world_to_screen(wx2, wy2)
-            _draw_arrow(sx1, sy1, sx2, sy2, (50, 220, 80), 3)
+            self._draw_arrow(sx1, sy1, sx2, sy2, (50, 220, 80), 3)
             # "START" label at base
-            label = self.font_small.render("START", True, (50, 220, 80))
+            label = self._render_cached("START", self.font_small, (50, 220, 80))
             self.screen.blit(label, (int(sx1) - label.get_width() // 2,
                                      int(sy1) - 16))
 
-        # Drag preview arrow (yellow)
+    def _draw_drag_previews(self):
+        """Checkpoint / power-up rectangle or direction arrow being dragged."""
+        if self.cp_drag_start and self.cp_drag_current:
+            self._draw_drag_rect(self.cp_drag_start, self.cp_drag_current,
+                                 (220, 180, 50))
+        if self.pu_drag_start and self.pu_drag_current:
+            self._draw_drag_rect(self.pu_drag_start, self.pu_drag_current,
+                                 (255, 180, 40))
         if self.dir_drag_start and self.dir_drag_current:
             wx1, wy1 = self.dir_drag_start
             wx2, wy2 = self.dir_drag_current
             sx1, sy1 = self.world_to_screen(wx1, wy1)
             sx2, sy2 = self.world_to_screen(wx2, wy2)
-            _draw_arrow(sx1, sy1, sx2, sy2, (220, 200, 50), 2)
+            self._draw_arrow(sx1, sy1, sx2, sy2, (220, 200, 50), 2)
+
+    def _draw_drag_rect(self, start, current, color):
+        x0, y0 = start
+        x1, y1 = current
+        sx0, sy0 = self.world_to_screen(min(x0, x1), min(y0, y1))
+        sx1, sy1 = self.world_to_screen(max(x0, x1), max(y0, y1))
+        sw = max(2, int(sx1 - sx0))
+        sh = max(2, int(sy1 - sy0))
+        self._blit_tint((int(sx0), int(sy0), sw, sh), (*color, 40))
+        pygame.draw.rect(self.screen, color, (int(sx0), int(sy0), sw, sh), 2)
 
     # ──────────────────────────────────────────
     # BOTTOM PANEL
@@ -1251,15 +1686,36 @@ class TileEditor:
 
     def _draw_status_bar(self):
         bar_y = SCREEN_HEIGHT - STATUS_BAR_H
-        bar_surf = pygame.Surface((SCREEN_WIDTH, STATUS_BAR_H), pygame.SRCALPHA)
-        bar_surf.fill(COL_BAR)
-        self.screen.blit(bar_surf, (0, bar_y))
+        self.screen.blit(self._bar_surf, (0, bar_y))
 
-        mx, my = pygame.mouse.get_pos()
+        cell = self._hover_cell()
+        tid = None
+        if cell is not None:
+            row, col = cell
+            if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
+                tid = int(self.terrain[row, col])
+        # Everything the line shows; the text is only rebuilt (and the
+        # friction looked up) when this changes
+        mgr = get_manager()
+        key = (int(self.zoom * 100), cell, tid, mgr.revision,
+               self.current_brush.width, self.current_brush.height,
+               self.current_rotation, self.direction_mode,
+               bool(self.circuit_direction), self.powerup_mode,
+               len(self.powerup_zones), self.checkpoint_mode,
+               len(self.checkpoint_zones), self.current_name)
+        if key != self._status_line[0]:
+            text = self._status_text(cell, tid)
+            # Kept out of _text_cache so the stream of cursor positions
+            # doesn't evict the static labels
+            self._status_line = (key, self.font.render(text, True, COLOR_GRAY))
+        self.screen.blit(self._status_line[1], (8, bar_y + 6))
+
+    def _status_text(self, cell, tid):
+        """Status bar line for the cursor cell (or None) and its tile."""
         parts = [f"Zoom:{int(self.zoom * 100)}%"]
 
-        if self._is_in_viewport(mx, my):
-            row, col = self.screen_to_tile(mx, my)
+        if cell is not None:
+            row, col = cell
             parts.append(f"Tile:({col},{row})")
 
         bw = self.current_brush.width
@@ -1268,14 +1724,9 @@ class TileEditor:
         parts.append(f"Rot:{self.current_rotation * 90}\u00b0")
 
         # Show friction of tile under cursor
-        if self._is_in_viewport(mx, my):
-            row, col = self.screen_to_tile(mx, my)
-            if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
-                tid = self.terrain[row][col]
-                if tid != T_EMPTY:
-                    mgr = get_manager()
-                    fric = mgr.get_friction(tid)
-                    parts.append(f"Friction:{fric:.1f}")
+        if tid is not None and tid != T_EMPTY:
+            fric = get_manager().get_friction(tid)
+            parts.append(f"Friction:{fric:.1f}")
 
         if self.direction_mode:
             parts.append("DIRECTION MODE")
@@ -1295,100 +1746,122 @@ class TileEditor:
         if self.current_name:
             parts.append(f"Track:{self.current_name}")
 
-        text = "  |  ".join(parts)
-        self.screen.blit(self.font.render(text, True, COLOR_GRAY), (8, bar_y + 6))
+        return "  |  ".join(parts)
+
+    def _render_cached(self, text, font=None, color=COLOR_GRAY):
+        """font.render() memoized on (text, font, color), oldest-first evicted."""
+        font = font or self.font
+        key = (text, font, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        return surf
 
     # ──────────────────────────────────────────
     # HELP / MESSAGES / DIALOGS
     # ──────────────────────────────────────────
 
     def _draw_help(self):
-        lines = [
-            "=== TILE EDITOR ===",
-            "",
-            "Left-click         Paint brush",
-            "Left-drag          Paint continuously",
-            "Right-click        Erase",
-            "",
-            "Middle-drag        Pan viewport",
-            "Space+drag         Pan viewport",
-            "Scroll             Zoom in/out",
-            "",
-            "Tileset: click     Select 1 tile",
-            "Tileset: drag      Select rectangle",
-            "Tileset: scroll    Zoom tileset",
-            "Tileset: R-drag    Pan tileset",
-            "Tabs               Filter by category",
-            "",
-            "R / Shift+R        Rotate tile CW/CCW",
-            "Shift+1/2/3        Brush size",
-            "Ctrl+Z / Ctrl+Y   Undo / Redo",
-            "Ctrl+S             Save track",
-            "Ctrl+O             Load track",
-            "Ctrl+N             New track",
-            "F                  Fit view",
-            "T                  Test track",
-            "C                  Checkpoint mode",
-            "  drag=place, R-click=delete",
-            "D                  Direction mode",
-            "  drag=set arrow, R-click=delete",
-            "P                  Power-up zone mode",
-            "  drag=place, R-click=delete",
-            "H                  Toggle help",
-            "ESC                Back to menu",
-            "",
-            "Property Inspector (right panel):",
-            "  Click fields to cycle values",
-        ]
+        # Rebuilt only if the font it was rendered with has been swapped
+        if self._help_surf is None or self._help_surf[0] is not self.font:
+            self._help_surf = (self.font, self._build_help_panel())
+        panel = self._help_surf[1]
+        x = max(10, SCREEN_WIDTH - panel.get_width() - 10)
+        self.screen.blit(panel, (x, 10))
+
+    def _build_help_panel(self):
 
         line_h = 19
         pad = 10
         max_w = 340
-        panel_h = len(lines) * line_h + pad * 2
+        panel_h = len(HELP_LINES) * line_h + pad * 2
 
         panel = pygame.Surface((max_w, panel_h), pygame.SRCALPHA)
         panel.fill((15, 15, 25, 220))
-        pygame.draw.rect(panel, (60, 80, 140), (0, 0, max_w, panel_h), 1)
+        pygame.gfxdraw.rectangle(panel, panel.get_rect(), (60, 80, 140))
 
-        for i, line in enumerate(lines):
-            col = COLOR_YELLOW if line.startswith("===") else (180, 190, 200)
-            panel.blit(self.font.render(line, True, col), (pad, pad + i * line_h))
-
-        x = max(10, SCREEN_WIDTH - max_w - 10)
-        self.screen.blit(panel, (x, 10))
+        panel.blits([
+            (self.font.render(
+                line, True,
+                COLOR_YELLOW if line.startswith("===") else (180, 190, 200)),
+             (pad, pad + i * line_h))
+            for i, line in enumerate(HELP_LINES) if line
+        ], doreturn=False)
+        return panel.convert_alpha()
 
     def _draw_status_message(self):
-        rendered = self.font_big.render(self.status_msg, True, COL_MSG)
+        rendered = self._render_cached(self.status_msg, self.font_big, COL_MSG)
         rect = rendered.get_rect(centerx=SCREEN_WIDTH // 2, top=10)
-        bg = pygame.Surface((rect.width + 20, rect.height + 10), pygame.SRCALPHA)
-        bg.fill((10, 10, 10, 180))
-        self.screen.blit(bg, (rect.x - 10, rect.y - 5))
+        self._blit_tint((rect.x - 10, rect.y - 5,
+                         rect.width + 20, rect.height + 10), (10, 10, 10, 180))
         self.screen.blit(rendered, rect)
 
+    def _tint_surface(self, size, rgba):
+        """Solid translucent block in display format. Uses surface alpha
+        rather than per-pixel alpha: SDL blends that without reading an
+        alpha channel per pixel."""
+        surf = pygame.Surface(size, 0, self.screen)
+        surf.fill(rgba[:3])
+        surf.set_alpha(rgba[3])
+        return surf
+
+    def _blit_tint(self, rect, rgba):
+        """Blend a solid rgba rectangle onto the screen (within the clip).
+
+        Blocks are pooled by colour and size rounded up to 32px (oldest
+        evicted first), and only the needed area is blitted, so nothing
+        is allocated per frame once the blocks in view are pooled.
+        """
+        r = pygame.Rect(rect).clip(self.screen.get_clip())
+        if not r.width or not r.height:
+            return
+        key = (rgba, -(-r.width // 32) * 32, -(-r.height // 32) * 32)
+        surf = self._tint_surfs.get(key)
+        if surf is None:
+            surf = self._tint_surface(key[1:], rgba)
+            self._tint_surfs[key] = surf
+            if len(self._tint_surfs) > TINT_POOL_SIZE:
+                del self._tint_surfs[next(iter(self._tint_surfs))]
+        self.screen.blit(surf, r.topleft, (0, 0, r.width, r.height))
+
+    def _dialog_bg(self, dw, dh):
+        """Translucent dialog background with border, built once per size."""
+        surf = self._dialog_bgs.get((dw, dh))
+        if surf is None:
+            surf = pygame.Surface((dw, dh), pygame.SRCALPHA)
+            surf.fill(COL_DIALOG_BG)
+            pygame.draw.rect(surf, COL_DIALOG_BORDER, (0, 0, dw, dh), 2)
+            surf = surf.convert_alpha()
+            self._dialog_bgs[(dw, dh)] = surf
+        return surf
+
     def _draw_save_dialog(self):
         dw, dh = 400, 160
         dx = (SCREEN_WIDTH - dw) // 2
         dy = (VIEWPORT_HEIGHT - dh) // 2
 
-        surf = pygame.Surface((dw, dh), pygame.SRCALPHA)
-        surf.fill(COL_DIALOG_BG)
-        pygame.draw.rect(surf, COL_DIALOG_BORDER, (0, 0, dw, dh), 2)
-        self.screen.blit(surf, (dx, dy))
+        self.screen.blit(self._dialog_bg(dw, dh), (dx, dy))
 
-        self.screen.blit(self.font_big.render("Save Track", True, COLOR_WHITE),
+        # Static labels come from the text cache; only the input is live
+        self.screen.blit(self._render_cached("Save Track", self.font_big, COLOR_WHITE),
                          (dx + 20, dy + 15))
-        self.screen.blit(self.font.render("Track name:", True, COLOR_GRAY),
+        self.screen.blit(self._render_cached("Track name:"),
                          (dx + 20, dy + 55))
 
         input_rect = pygame.Rect(dx + 20, dy + 78, dw - 40, 30)
         pygame.draw.rect(self.screen, COL_INPUT_BG, input_rect)
         pygame.draw.rect(self.screen, COL_DIALOG_BORDER, input_rect, 1)
-        self.screen.blit(
-            self.font.render(self.dialog_input + "|", True, COLOR_WHITE),
-            (input_rect.x + 6, input_rect.y + 7))
+        if self._input_line[0] != self.dialog_input:
+            self._input_line = (self.dialog_input, self.font.render(
+                self.dialog_input + "|", True, COLOR_WHITE))
+        self.screen.blit(self._input_line[1],
+                         (input_rect.x + 6, input_rect.y + 7))
 
         self.screen.blit(
-            self.font.render("ENTER to save  |  ESC to cancel", True, COLOR_GRAY),
+            self._render_cached("ENTER to save  |  ESC to cancel"),
             (dx + 20, dy + 125))
 
     def _draw_load_dialog(self):
@@ -1396,41 +1869,50 @@ class TileEditor:
         dx = (SCREEN_WIDTH - dw) // 2
         dy = (VIEWPORT_HEIGHT - dh) // 2
 
-        surf = pygame.Surface((dw, dh), pygame.SRCALPHA)
-        surf.fill(COL_DIALOG_BG)
-        pygame.draw.rect(surf, COL_DIALOG_BORDER, (0, 0, dw, dh), 2)
-        self.screen.blit(surf, (dx, dy))
+        self.screen.blit(self._dialog_bg(dw, dh), (dx, dy))
 
-        self.screen.blit(self.font_big.render("Load Track", True, COLOR_WHITE),
+        self.screen.blit(self._render_cached("Load Track", self.font_big, COLOR_WHITE),
                          (dx + 20, dy + 15))
 
         if not self.dialog_tracks:
-            self.screen.blit(self.font.render("No tracks found", True, COLOR_GRAY),
+            self.screen.blit(self._render_cached("No tracks found"),
                              (dx + 20, dy + 60))
         else:
             visible = 12
             start = max(0, self.dialog_selected - visible + 1)
             end = min(len(self.dialog_tracks), start + visible)
 
+            blit_seq = []
             for i_draw, i in enumerate(range(start, end)):
                 entry = self.dialog_tracks[i]
                 yy = dy + 50 + i_draw * 26
+                selected = i == self.dialog_selected
 
-                if i == self.dialog_selected:
+                if selected:
                     pygame.draw.rect(self.screen, (40, 50, 80),
                                      pygame.Rect(dx + 10, yy, dw - 20, 24))
 
                 track_type = entry.get("type", "classic")
-                type_color = COLOR_GREEN if track_type == "tiles" else (180, 140, 60)
-
-                color = COLOR_WHITE if i == self.dialog_selected else COLOR_GRAY
-                name_surf = self.font.render(entry["name"], True, color)
-                type_surf = self.font_small.render(f"[{track_type}]", True, type_color)
-                self.screen.blit(name_surf, (dx + 20, yy + 3))
-                self.screen.blit(type_surf,
-                                 (dx + 20 + name_surf.get_width() + 8, yy + 5))
+                key = (entry["name"], track_type, selected)
+                row = self._track_rows.get(key)
+                if row is None:
+                    type_color = COLOR_GREEN if track_type == "tiles" else (180, 140, 60)
+                    color = COLOR_WHITE if selected else COLOR_GRAY
+                    row = (self.font.render(entry["name"], True, color),
+                           self.font_small.render(f"[{track_type}]", True, type_color))
+                    self._track_rows[key] = row
+                name_surf, type_surf = row
+                blit_seq.append((name_surf, (dx + 20, yy + 3)))
+                blit_seq.append(
+                    (type_surf, (dx + 20 + name_surf.get_width() + 8, yy + 5)))
+
+            # Long names stay inside the dialog
+            prev_clip = self.screen.get_clip()
+            self.screen.set_clip(pygame.Rect(
+                dx + 10, dy + 50, dw - 20, visible * 26).clip(prev_clip))
+            self.screen.blits(blit_seq, doreturn=False)
+            self.screen.set_clip(prev_clip)
 
         self.screen.blit(
-            self.font.render("UP/DOWN select | ENTER load | ESC cancel",
-                             True, COLOR_GRAY),
+            self._render_cached("UP/DOWN select | ENTER load | ESC cancel"),
             (dx + 20, dy + dh - 30))
@@ -42,6 +42,8 @@ COL_GRAY = (140, 140, 140)
 VERTEX_RADIUS = 6
 VERTEX_GRAB_DIST = 12
 
+TEXT_CACHE_SIZE = 32  # rendered label strings kept by _text
+
 
 class CollisionEditor:
     """Modal overlay for editing a tile's collision polygon."""
@@ -77,6 +79,21 @@ class CollisionEditor:
         # Dragging
         self.dragging_idx = -1
 
+        # Cursor position, kept up to date by the owner from mouse events
+        # so drawing never has to poll SDL
+        self.mouse_pos = (0, 0)
+
+        # (screen points, Surface) of the last polygon fill
+        self._poly_fill = None
+        self._snap_grids = {}  # subdivisions -> grid line overlay
+        self._dim = None  # (size, Surface) darkening everything behind
+        self._text_cache = {}  # (text, font, color) -> Surface
+
+        # Modal background, static for the editor's lifetime
+        self._modal_bg = pygame.Surface((MODAL_W, MODAL_H), pygame.SRCALPHA)
+        self._modal_bg.fill(COL_BG)
+        pygame.draw.rect(self._modal_bg, COL_BORDER, (0, 0, MODAL_W, MODAL_H), 2)
+
         # Scaled tile sprite
         sprite = get_tile_sprite(tile_id)
         if sprite is not None:
@@ -109,11 +126,14 @@ class CollisionEditor:
 
     def _nearest_vertex(self, sx, sy):
         """Return index of nearest vertex within grab distance, or -1."""
-        best_dist = VERTEX_GRAB_DIST ** 2
+        best_dist = VERTEX_GRAB_DIST * VERTEX_GRAB_DIST
         best_idx = -1
+        # _norm_to_screen inlined, relative to the preview origin
+        rx, ry = sx - self.px, sy - self.py
         for i, (vx, vy) in enumerate(self.vertices):
-            vsx, vsy = self._norm_to_screen(vx, vy)
-            d2 = (sx - vsx) ** 2 + (sy - vsy) ** 2
+            dx = rx - int(vx * PREVIEW_SIZE)
+            dy = ry - int(vy * PREVIEW_SIZE)
+            d2 = dx * dx + dy * dy
             if d2 < best_dist:
                 best_dist = d2
                 best_idx = i
@@ -179,18 +199,21 @@ class CollisionEditor:
 
     def _best_insert_index(self, nx, ny):
         """Find the edge where inserting a new vertex produces least distortion."""
-        if len(self.vertices) < 2:
-            return len(self.vertices)
+        verts = self.vertices
+        n = len(verts)
+        if n < 2:
+            return n
         best_dist = float('inf')
-        best_i = len(self.vertices)
-        for i in range(len(self.vertices)):
-            j = (i + 1) % len(self.vertices)
-            ax, ay = self.vertices[i]
-            bx, by = self.vertices[j]
-            # Distance from point to segment midpoint
-            mx = (ax + bx) / 2
-            my = (ay + by) / 2
-            d = (nx - mx) ** 2 + (ny - my) ** 2
+        best_i = n
+        # Compare against twice the midpoint: same ordering, no halving
+        nx2, ny2 = nx + nx, ny + ny
+        for i in range(n):
+            j = i + 1 if i + 1 < n else 0
+            ax, ay = verts[i]
+            bx, by = verts[j]
+            dx = nx2 - (ax + bx)
+            dy = ny2 - (ay + by)
+            d = dx * dx + dy * dy
             if d < best_dist:
                 best_dist = d
                 best_i = j
@@ -207,21 +230,48 @@ class CollisionEditor:
 
     # ── Drawing ──
 
+    def _text(self, text, font, color):
+        """font.render() memoized on (text, font, color), oldest-first evicted."""
+        key = (text, font, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        return surf
+
+    def _get_snap_grid(self):
+        """Snap grid lines for the current subdivision as a transparent
+        PREVIEW_SIZE overlay (built once per setting), or None when off."""
+        subdiv = SNAP_OPTIONS[self.snap_idx]
+        if subdiv == 0:
+            return None
+        grid = self._snap_grids.get(subdiv)
+        if grid is None:
+            grid = pygame.Surface((PREVIEW_SIZE, PREVIEW_SIZE), pygame.SRCALPHA)
+            for i in range(1, subdiv):
+                p = int(i / subdiv * PREVIEW_SIZE)
+                pygame.draw.line(grid, COL_GRID, (p, 0), (p, PREVIEW_SIZE))
+                pygame.draw.line(grid, COL_GRID, (0, p), (PREVIEW_SIZE, p))
+            self._snap_grids[subdiv] = grid
+        return grid
+
     def draw(self, surface: pygame.Surface):
-        # Dim background
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        surface.blit(overlay, (0, 0))
+        # Dim background (rebuilt only if the target size changes)
+        size = surface.get_size()
+        if self._dim is None or self._dim[0] != size:
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            self._dim = (size, overlay)
+        surface.blit(self._dim[1], (0, 0))
 
         # Modal background
-        modal_surf = pygame.Surface((MODAL_W, MODAL_H), pygame.SRCALPHA)
-        modal_surf.fill(COL_BG)
-        pygame.draw.rect(modal_surf, COL_BORDER, (0, 0, MODAL_W, MODAL_H), 2)
-        surface.blit(modal_surf, (self.ox, self.oy))
+        surface.blit(self._modal_bg, (self.ox, self.oy))
 
         # Title
-        title = self.font.render(f"Collision Editor - Tile #{self.tile_id}",
-                                 True, COL_WHITE)
+        title = self._text(f"Collision Editor - Tile #{self.tile_id}",
+                           self.font, COL_WHITE)
         surface.blit(title, (self.ox + MARGIN, self.oy + 6))
 
         # Tile sprite
@@ -229,29 +279,28 @@ class CollisionEditor:
 
         # Snap grid
         subdiv = SNAP_OPTIONS[self.snap_idx]
-        if subdiv > 0:
-            for i in range(1, subdiv):
-                t = i / subdiv
-                x = self.px + int(t * PREVIEW_SIZE)
-                y = self.py + int(t * PREVIEW_SIZE)
-                pygame.draw.line(surface, COL_GRID,
-                                 (x, self.py), (x, self.py + PREVIEW_SIZE))
-                pygame.draw.line(surface, COL_GRID,
-                                 (self.px, y), (self.px + PREVIEW_SIZE, y))
+        grid = self._get_snap_grid()
+        if grid is not None:
+            surface.blit(grid, (self.px, self.py))
 
         # Polygon fill
         if len(self.vertices) >= 3:
             points = [self._norm_to_screen(v[0], v[1]) for v in self.vertices]
-            poly_surf = pygame.Surface((PREVIEW_SIZE, PREVIEW_SIZE), pygame.SRCALPHA)
-            local_pts = [(p[0] - self.px, p[1] - self.py) for p in points]
-            pygame.draw.polygon(poly_surf, COL_POLY_FILL, local_pts)
-            surface.blit(poly_surf, (self.px, self.py))
+            # Refilled only when a vertex moved, was added or was removed
+            key = tuple(points)
+            if self._poly_fill is None or self._poly_fill[0] != key:
+                poly_surf = pygame.Surface((PREVIEW_SIZE, PREVIEW_SIZE),
+                                           pygame.SRCALPHA)
+                local_pts = [(p[0] - self.px, p[1] - self.py) for p in points]
+                pygame.draw.polygon(poly_surf, COL_POLY_FILL, local_pts)
+                self._poly_fill = (key, poly_surf)
+            surface.blit(self._poly_fill[1], (self.px, self.py))
 
             # Outline
             pygame.draw.polygon(surface, COL_POLY_LINE, points, 2)
 
         # Vertices
-        mx, my = pygame.mouse.get_pos()
+        mx, my = self.mouse_pos
         hover_idx = self._nearest_vertex(mx, my)
         for i, (vx, vy) in enumerate(self.vertices):
             sx, sy = self._norm_to_screen(vx, vy)
@@ -280,5 +329,5 @@ class CollisionEditor:
         ]
         for i, line in enumerate(instructions):
             col = COL_GRAY if not line else COL_WHITE
-            surface.blit(self.font_small.render(line, True, col),
+            surface.blit(self._text(line, self.font_small, col),
                          (ix, iy + i * 18))
@@ -7,13 +7,17 @@ ToolsPanel (brush management), PropertyInspector (per-tile metadata editing).
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import OrderedDict
+
+import numpy as np
 import pygame
 
 from tile_defs import (
     T_EMPTY, T_FINISH, TILE_BASE, TILE_BASE_PX,
     is_driveable, get_tile_sprite, get_tile_category,
     get_tileset_sheet, get_tileset_dimensions,
-    get_tile_at_position, get_tile_info,
+    get_all_tile_ids, get_tile_info,
     make_grass_sprite, make_finish_sprite,
 )
 from tile_meta import (
@@ -49,6 +53,11 @@ TILE_PREVIEW_SIZE = 48
 BROWSER_ZOOM_MIN = 3
 BROWSER_ZOOM_MAX = 48
 
+# Whole-sheet scaled copies are kept up to this size (pixels) and count;
+# above it only the visible block is scaled (48x sheet would be ~66 MB)
+SCALED_SHEET_MAX_PX = 4_000_000
+SCALED_SHEET_CACHE = 4
+
 # Tab definitions: label, filter category (None = all)
 TABS = [
     ("All", None),
@@ -60,12 +69,19 @@ TABS = [
 
 TAB_HEIGHT = 24
 
+# Rendered label strings kept per panel by Panel._text
+TEXT_CACHE_SIZE = 128
+
 
 class Panel:
     """Base class for editor panels."""
 
     def __init__(self, rect: pygame.Rect):
         self.rect = rect
+        # Cursor position, kept up to date by the owner from mouse events
+        # so drawing never has to poll SDL
+        self.mouse_pos = (0, 0)
+        self._text_cache = {}  # (text, font, color) -> Surface
 
     def handle_event(self, event) -> bool:
         """Process an event.  Return True if consumed."""
@@ -80,6 +96,18 @@ class Panel:
     def contains(self, x: int, y: int) -> bool:
         return self.rect.collidepoint(x, y)
 
+    def _text(self, text: str, font: pygame.font.Font,
+              color) -> pygame.Surface:
+        """font.render() memoized on (text, font, color), oldest-first evicted."""
+        key = (text, font, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+        return surf
+
 
 # ══════════════════════════════════════════════
 # TILESET BROWSER
@@ -112,6 +140,35 @@ class TilesetBrowser(Panel):
 
         # Hover
         self.hover_tile = None  # (src_row, src_col, tile_id) or None
+        self._hover = (None, None, None)  # (cursor/view key, hover_tile, Rect)
+
+        # Scaled tileset: zoom -> whole sheet (LRU), plus the last
+        # visible block for zooms too large to scale whole
+        self._scaled_sheets = OrderedDict()
+        self._scaled_block = None  # ((z, c0, r0, c1, r1), Surface), padded
+        self._scale_buf = None     # reused destination for _scaled_block
+        self._grid_overlay = None  # (z, Surface) repeating grid lines
+        self._grid_area = None     # (inputs, overlay area Rect) of last draw
+        self._sel_fill = None      # content-sized translucent selection fill
+        self._tile_grid = None     # (rows, cols) tile IDs, T_EMPTY = none
+        self._filter_mask = None   # ((filter, revision), bool array)
+        self._zoom_consts = {}     # z -> derived sizes, see _get_zoom_consts
+        self._tab_strip = None     # ((active, hovered), Surface) of the tabs
+        self._content_key = None   # inputs of the drawing held in _content_surf
+        self._content_surf = None  # content area as of the last full redraw
+
+        # Hit-test rects (the panel never moves), checked in C by collidepoint
+        self._tabs_rect = pygame.Rect(rect.x, rect.y, rect.width, TAB_HEIGHT)
+        self._content_rect = pygame.Rect(
+            rect.x, rect.y + TAB_HEIGHT, rect.width, rect.height - TAB_HEIGHT)
+
+        # Event type -> handler, one dict lookup per event
+        self._handlers = {
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+            pygame.MOUSEBUTTONUP: self._on_mouse_up,
+            pygame.MOUSEMOTION: self._on_mouse_motion,
+            pygame.MOUSEWHEEL: self._on_mouse_wheel,
+        }
 
         # Result: callback will be set by editor
         self.on_tile_selected = None    # fn(tile_id)
@@ -121,17 +178,13 @@ class TilesetBrowser(Panel):
 
     @property
     def content_rect(self) -> pygame.Rect:
-        return pygame.Rect(
-            self.rect.x, self.rect.y + TAB_HEIGHT,
-            self.rect.width, self.rect.height - TAB_HEIGHT,
-        )
+        return self._content_rect
 
     def _in_content(self, x, y):
-        return self.content_rect.collidepoint(x, y)
+        return self._content_rect.collidepoint(x, y)
 
     def _in_tabs(self, x, y):
-        return (self.rect.x <= x < self.rect.right and
-                self.rect.y <= y < self.rect.y + TAB_HEIGHT)
+        return self._tabs_rect.collidepoint(x, y)
 
     # ── Coordinate helpers ──
 
@@ -145,48 +198,111 @@ class TilesetBrowser(Panel):
         ts_row = int((py + self.scroll_y) / z)
         return ts_row, ts_col
 
+    def _tileset_to_screen(self, ts_row, ts_col, z, sx, sy):
+        """Screen position of a tileset cell's top-left corner."""
+        cr = self.content_rect
+        return cr.x + int(ts_col * z - sx), cr.y + int(ts_row * z - sy)
+
+    def _get_zoom_consts(self, z):
+        """Sizes derived from the zoom level, computed once per level."""
+        consts = self._zoom_consts.get(z)
+        if consts is None:
+            cr = self.content_rect
+            tile_sz = max(1, int(z))
+            dim = pygame.Surface((tile_sz, tile_sz), pygame.SRCALPHA)
+            dim.fill((0, 0, 0, 140))
+            dim = dim.convert_alpha()
+            consts = {
+                'tile_sz': tile_sz,
+                'hover_thick': max(1, int(z / 12)),
+                'grid_alpha': min(60, int(z * 3)),
+                'view_cols': int(cr.width / z) + 2,
+                'view_rows': int(cr.height / z) + 2,
+                'dim': dim,  # filter overlay cell
+            }
+            self._zoom_consts[z] = consts
+        return consts
+
+    def _visible_range(self, z, sx, sy, ts_cols, ts_rows):
+        """(col0, row0, col1, row1) of tileset cells in view, end-exclusive."""
+        consts = self._get_zoom_consts(z)
+        col0 = max(0, int(sx / z))
+        row0 = max(0, int(sy / z))
+        col1 = min(ts_cols, col0 + consts['view_cols'])
+        row1 = min(ts_rows, row0 + consts['view_rows'])
+        return col0, row0, col1, row1
+
+    def _get_tile_grid(self):
+        """Tileset position -> tile ID array, built once from tile_defs."""
+        if self._tile_grid is None:
+            ts_cols, ts_rows = get_tileset_dimensions()
+            grid = np.full((ts_rows, ts_cols), T_EMPTY, dtype=np.int32)
+            # Scatter the loaded tiles to their source cells in one go
+            # rather than probing every cell of the sheet
+            ids = get_all_tile_ids()
+            if ids:
+                infos = [get_tile_info(tid) for tid in ids]
+                grid[[t['src_row'] for t in infos],
+                     [t['src_col'] for t in infos]] = ids
+            self._tile_grid = grid
+        return self._tile_grid
+
+    def _tile_at(self, ts_row, ts_col):
+        """Tile ID at a tileset position, or None (empty / out of range)."""
+        grid = self._get_tile_grid()
+        if 0 <= ts_row < grid.shape[0] and 0 <= ts_col < grid.shape[1]:
+            tid = int(grid[ts_row, ts_col])
+            if tid != T_EMPTY:
+                return tid
+        return None
+
     # ── Events ──
 
     def handle_event(self, event) -> bool:
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            sx, sy = event.pos
-            if self._in_tabs(sx, sy):
-                return self._handle_tab_click(sx, sy)
-            if self._in_content(sx, sy):
-                if event.button == 1:
-                    return self._handle_content_click(sx, sy)
-                if event.button in (2, 3):
-                    self.panning = True
-                    self.pan_start = (sx, sy)
-                    self.scroll_start = (self.scroll_x, self.scroll_y)
-                    return True
+        handler = self._handlers.get(event.type)
+        return handler(event) if handler is not None else False
 
-        elif event.type == pygame.MOUSEBUTTONUP:
+    def _on_mouse_down(self, event):
+        sx, sy = event.pos
+        if self._in_tabs(sx, sy):
+            return self._handle_tab_click(sx, sy)
+        if self._in_content(sx, sy):
+            if event.button == 1:
+                return self._handle_content_click(sx, sy)
             if event.button in (2, 3):
-                self.panning = False
-            if event.button == 1 and self.selecting:
-                self._finish_selection(event.pos)
+                self.panning = True
+                self.pan_start = (sx, sy)
+                self.scroll_start = (self.scroll_x, self.scroll_y)
                 return True
+        return False
 
-        elif event.type == pygame.MOUSEMOTION:
-            sx, sy = event.pos
-            if self.panning:
-                dx = sx - self.pan_start[0]
-                dy = sy - self.pan_start[1]
-                self.scroll_x = self.scroll_start[0] - dx
-                self.scroll_y = self.scroll_start[1] - dy
-                return True
-            if self.selecting and self._in_content(sx, sy):
-                r, c = self._screen_to_tileset(sx, sy)
-                self.sel_end = (r, c)
-                return True
+    def _on_mouse_up(self, event):
+        if event.button in (2, 3):
+            self.panning = False
+        if event.button == 1 and self.selecting:
+            self._finish_selection(event.pos)
+            return True
+        return False
 
-        elif event.type == pygame.MOUSEWHEEL:
-            mx, my = pygame.mouse.get_pos()
-            if self._in_content(mx, my):
-                self._zoom_at(event.y, mx, my)
-                return True
+    def _on_mouse_motion(self, event):
+        sx, sy = event.pos
+        if self.panning:
+            dx = sx - self.pan_start[0]
+            dy = sy - self.pan_start[1]
+            self.scroll_x = self.scroll_start[0] - dx
+            self.scroll_y = self.scroll_start[1] - dy
+            return True
+        if self.selecting and self._in_content(sx, sy):
+            r, c = self._screen_to_tileset(sx, sy)
+            self.sel_end = (r, c)
+            return True
+        return False
 
+    def _on_mouse_wheel(self, event):
+        mx, my = self.mouse_pos
+        if self._in_content(mx, my):
+            self._zoom_at(event.y, mx, my)
+            return True
         return False
 
     def _handle_tab_click(self, sx, sy):
@@ -198,7 +314,7 @@ class TilesetBrowser(Panel):
 
     def _handle_content_click(self, sx, sy):
         r, c = self._screen_to_tileset(sx, sy)
-        tid = get_tile_at_position(r, c)
+        tid = self._tile_at(r, c)
 
         # Check tab filter
         if tid is not None and not self._passes_filter(tid):
@@ -223,7 +339,7 @@ class TilesetBrowser(Panel):
 
         # Single tile?
         if sr0 == sr1 and sc0 == sc1:
-            tid = get_tile_at_position(sr0, sc0)
+            tid = self._tile_at(sr0, sc0)
             if tid is not None and self.on_tile_selected:
                 self.on_tile_selected(tid)
         else:
@@ -237,8 +353,7 @@ class TilesetBrowser(Panel):
         _, cat_filter = TABS[self.active_tab]
         if cat_filter is None:
             return True
-        mgr = get_manager()
-        return mgr.get_category(tile_id) == cat_filter
+        return get_manager().get_category(tile_id) == cat_filter
 
     def _zoom_at(self, direction, mx, my):
         cr = self.content_rect
@@ -264,39 +379,64 @@ class TilesetBrowser(Panel):
         # Tabs
         self._draw_tabs(surface)
 
-        # Content
+        # Content: redrawn only when what it shows changed, else copied
+        # back from the last redraw; the hover outline goes on top
         cr = self.content_rect
         surface.set_clip(cr)
-        self._draw_tileset_content(surface)
+        if self._content_key != self._content_state():
+            self._draw_tileset_content(surface)
+            if self._content_surf is None:
+                self._content_surf = pygame.Surface(cr.size, 0, surface)
+            self._content_surf.blit(surface, (0, 0), cr)
+            # Taken after drawing, which clamps the scroll
+            self._content_key = self._content_state()
+        else:
+            surface.blit(self._content_surf, cr.topleft)
+        if get_tileset_sheet() is not None:
+            self._update_hover(surface, self.zoom,
+                               self.scroll_x, self.scroll_y)
         surface.set_clip(None)
 
+    def _content_state(self):
+        """Everything the content area's drawing depends on, bar the hover."""
+        return (self.zoom, self.scroll_x, self.scroll_y, self.active_tab,
+                self.selecting, self.sel_start, self.sel_end,
+                get_manager().revision)
+
     def _draw_tabs(self, surface):
         tab_w = self.rect.width // len(TABS)
-        mx, my = pygame.mouse.get_pos()
-        for i, (label, _) in enumerate(TABS):
-            tx = self.rect.x + i * tab_w
-            ty = self.rect.y
-            r = pygame.Rect(tx, ty, tab_w, TAB_HEIGHT)
-
-            if i == self.active_tab:
-                color = COL_TAB_ACTIVE
-            elif r.collidepoint(mx, my):
-                color = COL_TAB_HOVER
-            else:
-                color = COL_TAB_INACTIVE
-
-            pygame.draw.rect(surface, color, r)
-            pygame.draw.rect(surface, COL_PANEL_BORDER, r, 1)
-
-            text_color = COL_YELLOW if i == self.active_tab else COL_GRAY
-            lbl = self.font.render(label, True, text_color)
-            surface.blit(lbl, (tx + (tab_w - lbl.get_width()) // 2,
-                               ty + (TAB_HEIGHT - lbl.get_height()) // 2))
+        mx, my = self.mouse_pos
+        hovered = -1
+        if self._tabs_rect.collidepoint(mx, my):
+            hovered = (mx - self.rect.x) // tab_w
+        # The strip only changes look when the active or hovered tab does
+        key = (self.active_tab, hovered)
+        if self._tab_strip is None or self._tab_strip[0] != key:
+            strip = pygame.Surface((tab_w * len(TABS), TAB_HEIGHT))
+            for i, (label, _) in enumerate(TABS):
+                r = pygame.Rect(i * tab_w, 0, tab_w, TAB_HEIGHT)
+
+                if i == self.active_tab:
+                    color = COL_TAB_ACTIVE
+                elif i == hovered:
+                    color = COL_TAB_HOVER
+                else:
+                    color = COL_TAB_INACTIVE
+
+                pygame.draw.rect(strip, color, r)
+                pygame.draw.rect(strip, COL_PANEL_BORDER, r, 1)
+
+                text_color = COL_YELLOW if i == self.active_tab else COL_GRAY
+                lbl = self._text(label, self.font, text_color)
+                strip.blit(lbl, (r.x + (tab_w - lbl.get_width()) // 2,
+                                 (TAB_HEIGHT - lbl.get_height()) // 2))
+            self._tab_strip = (key, strip)
+        surface.blit(self._tab_strip[1], self.rect.topleft)
 
     def _draw_tileset_content(self, surface):
         sheet = get_tileset_sheet()
         if sheet is None:
-            lbl = self.font.render("No tileset", True, COL_GRAY)
+            lbl = self._text("No tileset", self.font, COL_GRAY)
             cr = self.content_rect
             surface.blit(lbl, (cr.x + 10, cr.y + 10))
             return
@@ -316,11 +456,7 @@ class TilesetBrowser(Panel):
         sx = self.scroll_x
         sy = self.scroll_y
 
-        # Visible tile range
-        col0 = max(0, int(sx / z))
-        row0 = max(0, int(sy / z))
-        col1 = min(ts_cols, col0 + int(cr.width / z) + 2)
-        row1 = min(ts_rows, row0 + int(cr.height / z) + 2)
+        col0, row0, col1, row1 = self._visible_range(z, sx, sy, ts_cols, ts_rows)
 
         if col1 <= col0 or row1 <= row0:
             return
@@ -334,16 +470,21 @@ class TilesetBrowser(Panel):
         if src_w <= 0 or src_h <= 0:
             return
 
-        sub = sheet.subsurface(pygame.Rect(src_x, src_y, src_w, src_h))
         dst_w = int(src_w * z / TILE_BASE_PX)
         dst_h = int(src_h * z / TILE_BASE_PX)
         if dst_w <= 0 or dst_h <= 0:
             return
 
-        scaled = pygame.transform.scale(sub, (dst_w, dst_h))
-        blit_x = cr.x + int(col0 * z - sx)
-        blit_y = cr.y + int(row0 * z - sy)
-        surface.blit(scaled, (blit_x, blit_y))
+        blit_x, blit_y = self._tileset_to_screen(row0, col0, z, sx, sy)
+        scaled_sheet = self._get_scaled_sheet(sheet, z)
+        if scaled_sheet is not None:
+            surface.blit(scaled_sheet, (blit_x, blit_y),
+                         pygame.Rect(col0 * z, row0 * z, dst_w, dst_h))
+        else:
+            block, bc0, br0 = self._get_scaled_block(
+                sheet, z, col0, row0, col1, row1)
+            surface.blit(block, (blit_x, blit_y), pygame.Rect(
+                (col0 - bc0) * z, (row0 - br0) * z, dst_w, dst_h))
 
         # Dim non-matching tiles when filtering
         _, cat_filter = TABS[self.active_tab]
@@ -361,58 +502,135 @@ class TilesetBrowser(Panel):
         # Current selection highlight
         self._draw_current_highlight(surface, z, sx, sy)
 
-        # Hover
-        self._update_hover(surface, z, sx, sy)
+    def _get_scaled_sheet(self, sheet, z):
+        """Whole tileset scaled to zoom z, or None if that would be too big."""
+        scaled = self._scaled_sheets.get(z)
+        if scaled is not None:
+            self._scaled_sheets.move_to_end(z)
+            return scaled
+        ts_cols, ts_rows = get_tileset_dimensions()
+        size = (ts_cols * z, ts_rows * z)
+        if size[0] * size[1] > SCALED_SHEET_MAX_PX:
+            return None
+        # Crop to whole tiles like the per-block path does
+        sub = sheet.subsurface(pygame.Rect(
+            0, 0, ts_cols * TILE_BASE_PX, ts_rows * TILE_BASE_PX))
+        scaled = pygame.transform.scale(sub, size)
+        self._scaled_sheets[z] = scaled
+        if len(self._scaled_sheets) > SCALED_SHEET_CACHE:
+            self._scaled_sheets.popitem(last=False)
+        return scaled
+
+    def _get_scaled_block(self, sheet, z, col0, row0, col1, row1):
+        """(Surface, col, row) of a scaled sheet block covering the view.
+
+        The block is padded by half a view on each side so scrolling
+        area-blits from it and only rescales once the view leaves it.
+        """
+        if self._scaled_block is not None:
+            (bz, bc0, br0, bc1, br1), block = self._scaled_block
+            if (bz == z and bc0 <= col0 and br0 <= row0
+                    and col1 <= bc1 and row1 <= br1):
+                return block, bc0, br0
+        ts_cols, ts_rows = get_tileset_dimensions()
+        pad_c = (col1 - col0) // 2 + 1
+        pad_r = (row1 - row0) // 2 + 1
+        bc0, br0 = max(0, col0 - pad_c), max(0, row0 - pad_r)
+        bc1, br1 = min(ts_cols, col1 + pad_c), min(ts_rows, row1 + pad_r)
+        sub = sheet.subsurface(pygame.Rect(
+            bc0 * TILE_BASE_PX, br0 * TILE_BASE_PX,
+            (bc1 - bc0) * TILE_BASE_PX, (br1 - br0) * TILE_BASE_PX))
+        size = ((bc1 - bc0) * z, (br1 - br0) * z)
+        block = self._get_scale_buf(sheet, *size)
+        pygame.transform.scale(sub, size, block)
+        self._scaled_block = ((z, bc0, br0, bc1, br1), block)
+        return block, bc0, br0
+
+    def _get_scale_buf(self, sheet, w, h):
+        """(w, h) view into a persistent buffer in the sheet's pixel format."""
+        buf = self._scale_buf
+        if buf is None or buf.get_width() < w or buf.get_height() < h:
+            bw, bh = w, h
+            if buf is not None:
+                bw, bh = max(w, buf.get_width()), max(h, buf.get_height())
+            buf = pygame.Surface((bw, bh), 0, sheet)
+            self._scale_buf = buf
+        return buf.subsurface((0, 0, w, h))
 
     def _draw_filter_overlay(self, surface, col0, row0, col1, row1,
                              z, sx, sy, cat_filter):
         """Dim tiles that don't match the active category filter."""
         cr = self.content_rect
+        dim = self._get_zoom_consts(z)['dim']
+        hidden = self._get_filter_mask(cat_filter)[row0:row1, col0:col1]
+        rows, cols = np.nonzero(hidden)
+        if not len(rows):
+            return
+        # Screen positions of the dimmed cells, truncated like int()
+        xs = (cr.x + ((cols + col0) * z - sx).astype(np.int32)).tolist()
+        ys = (cr.y + ((rows + row0) * z - sy).astype(np.int32)).tolist()
+        surface.blits([(dim, pos) for pos in zip(xs, ys)], doreturn=False)
+
+    def _get_filter_mask(self, cat_filter):
+        """Bool array over the tileset: True where a tile is outside
+        cat_filter. Rebuilt when the filter or the tile metadata changes."""
         mgr = get_manager()
-        dim = pygame.Surface((max(1, int(z)), max(1, int(z))), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 140))
-        for r in range(row0, row1):
-            for c in range(col0, col1):
-                tid = get_tile_at_position(r, c)
-                if tid is None:
-                    continue
-                if mgr.get_category(tid) != cat_filter:
-                    tx = cr.x + int(c * z - sx)
-                    ty = cr.y + int(r * z - sy)
-                    surface.blit(dim, (tx, ty))
+        key = (cat_filter, mgr.revision)
+        if self._filter_mask is None or self._filter_mask[0] != key:
+            grid = self._get_tile_grid()
+            # Compare the category table once, then gather it by tile ID
+            table = mgr.category_table(int(grid.max(initial=0)) + 1)
+            hide = np.array([cat != cat_filter for cat in table], dtype=bool)
+            hide[T_EMPTY] = False
+            self._filter_mask = (key, hide[grid])
+        return self._filter_mask[1]
 
     def _draw_grid(self, surface, col0, row0, col1, row1, z, sx, sy):
         cr = self.content_rect
-        alpha = min(60, int(z * 3))
-        grid_surf = pygame.Surface((cr.width, cr.height), pygame.SRCALPHA)
-        color = (255, 255, 255, alpha)
-        for col in range(col0, col1 + 1):
-            x = int(col * z - sx)
-            if 0 <= x < cr.width:
-                pygame.draw.line(grid_surf, color, (x, 0), (x, cr.height))
-        for row in range(row0, row1 + 1):
-            y = int(row * z - sy)
-            if 0 <= y < cr.height:
-                pygame.draw.line(grid_surf, color, (0, y), (cr.width, y))
-        surface.blit(grid_surf, (cr.x, cr.y))
+        # Lines every z px, built once per zoom and shifted by the scroll
+        if self._grid_overlay is None or self._grid_overlay[0] != z:
+            alpha = self._get_zoom_consts(z)['grid_alpha']
+            color = (255, 255, 255, alpha)
+            w, h = cr.width + z, cr.height + z
+            grid_surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            # Axis-aligned 1px strips: plain fills, no line rasterizing
+            for x in range(0, w, z):
+                grid_surf.fill(color, (x, 0, 1, h))
+            for y in range(0, h, z):
+                grid_surf.fill(color, (0, y, w, 1))
+            self._grid_overlay = (z, grid_surf.convert_alpha())
+        # Which part of the overlay is in view only changes with pan/zoom
+        key = (z, sx, sy, col0, row0, col1, row1)
+        if self._grid_area is None or self._grid_area[0] != key:
+            ox = int((col0 + 1) * z - sx) - z
+            oy = int((row0 + 1) * z - sy) - z
+            # Stop at the tileset's last grid line
+            right = min(cr.width, int(col1 * z - sx) + 1)
+            bottom = min(cr.height, int(row1 * z - sy) + 1)
+            self._grid_area = (key, pygame.Rect(-ox, -oy, right, bottom))
+        surface.blit(self._grid_overlay[1], cr.topleft, self._grid_area[1])
 
     def _draw_selection_rect(self, surface, z, sx, sy):
         """Draw the in-progress rectangular selection."""
         if not self.selecting or self.sel_start is None or self.sel_end is None:
             return
-        cr = self.content_rect
         r0, c0 = self.sel_start
         r1, c1 = self.sel_end
         sr0, sr1 = sorted((r0, r1))
         sc0, sc1 = sorted((c0, c1))
-        x = cr.x + int(sc0 * z - sx)
-        y = cr.y + int(sr0 * z - sy)
+        x, y = self._tileset_to_screen(sr0, sc0, z, sx, sy)
         w = int((sc1 - sc0 + 1) * z)
         h = int((sr1 - sr0 + 1) * z)
-        # Semi-transparent fill
-        sel_surf = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
-        sel_surf.fill((255, 220, 50, 40))
-        surface.blit(sel_surf, (x, y))
+        # Semi-transparent fill: the part inside the panel, cut from a
+        # persistent surface instead of allocating one per frame
+        cr = self.content_rect
+        if self._sel_fill is None:
+            self._sel_fill = pygame.Surface(cr.size, pygame.SRCALPHA)
+            self._sel_fill.fill((255, 220, 50, 40))
+            self._sel_fill = self._sel_fill.convert_alpha()
+        shown = pygame.Rect(x, y, max(1, w), max(1, h)).clip(cr)
+        if shown:
+            surface.blit(self._sel_fill, shown.topleft, ((0, 0), shown.size))
         pygame.draw.rect(surface, COL_TILE_SELECTED, (x, y, w, h), 2)
 
     def _draw_current_highlight(self, surface, z, sx, sy):
@@ -421,21 +639,25 @@ class TilesetBrowser(Panel):
         pass
 
     def _update_hover(self, surface, z, sx, sy):
-        mx, my = pygame.mouse.get_pos()
-        cr = self.content_rect
-        self.hover_tile = None
-        if not cr.collidepoint(mx, my):
-            return
-        ts_row, ts_col = self._screen_to_tileset(mx, my)
-        tid = get_tile_at_position(ts_row, ts_col)
-        if tid is not None:
-            self.hover_tile = (ts_row, ts_col, tid)
-            hx = cr.x + int(ts_col * z - sx)
-            hy = cr.y + int(ts_row * z - sy)
-            tile_sz = max(1, int(z))
-            thickness = max(1, int(z / 12))
-            pygame.draw.rect(surface, COL_TILE_HOVER,
-                             (hx, hy, tile_sz, tile_sz), thickness)
+        # The hovered cell and its outline only move with the cursor or
+        # the view, so they're worked out once per change
+        key = (self.mouse_pos, z, sx, sy)
+        if key != self._hover[0]:
+            hover = rect = None
+            mx, my = self.mouse_pos
+            if self.content_rect.collidepoint(mx, my):
+                ts_row, ts_col = self._screen_to_tileset(mx, my)
+                tid = self._tile_at(ts_row, ts_col)
+                if tid is not None:
+                    hover = (ts_row, ts_col, tid)
+                    hx, hy = self._tileset_to_screen(ts_row, ts_col, z, sx, sy)
+                    tile_sz = self._get_zoom_consts(z)['tile_sz']
+                    rect = pygame.Rect(hx, hy, tile_sz, tile_sz)
+            self._hover = (key, hover, rect)
+        _, self.hover_tile, rect = self._hover
+        if rect is not None:
+            pygame.draw.rect(surface, COL_TILE_HOVER, rect,
+                             self._get_zoom_consts(z)['hover_thick'])
 
 
 # ══════════════════════════════════════════════
@@ -543,49 +765,49 @@ class ToolsPanel(Panel):
             brush_text = f"Brush: {current_brush.width}x{current_brush.height}"
         else:
             brush_text = "Brush: 1x1"
-        surface.blit(self.font.render(brush_text, True, COL_GRAY),
+        surface.blit(self._text(brush_text, self.font, COL_GRAY),
                      (rx + 6, info_y))
 
         # Rotation info
         rot_text = f"Rot: {current_rotation * 90}\u00b0"
         rot_color = COL_YELLOW if current_rotation != 0 else COL_GRAY
-        surface.blit(self.font.render(rot_text, True, rot_color),
+        surface.blit(self._text(rot_text, self.font, rot_color),
                      (rx + 70, info_y))
 
         if selected_tile == T_EMPTY:
-            surface.blit(self.font.render("Grass (eraser)", True, COL_WHITE),
+            surface.blit(self._text("Grass (eraser)", self.font, COL_WHITE),
                          (rx + 6, info_y + 15))
         elif selected_tile == T_FINISH:
-            surface.blit(self.font.render("Finish Line", True, COL_WHITE),
+            surface.blit(self._text("Finish Line", self.font, COL_WHITE),
                          (rx + 6, info_y + 15))
-            surface.blit(self.font.render("Driveable", True, COL_DRIVEABLE),
+            surface.blit(self._text("Driveable", self.font, COL_DRIVEABLE),
                          (rx + 6, info_y + 28))
         elif current_brush and current_brush.width == 1 and current_brush.height == 1:
             tid = current_brush.tiles[0][0]
             mgr = get_manager()
             meta = mgr.get(tid)
             cat_name = CATEGORY_DISPLAY.get(meta.category, "?")
-            surface.blit(self.font.render(f"{cat_name} #{tid - TILE_BASE}", True, COL_WHITE),
+            surface.blit(self._text(f"{cat_name} #{tid - TILE_BASE}", self.font, COL_WHITE),
                          (rx + 6, info_y + 15))
             drive_text = "Driveable" if not meta.blocks_movement else "Solid"
             drive_color = COL_DRIVEABLE if not meta.blocks_movement else (200, 80, 80)
-            surface.blit(self.font.render(drive_text, True, drive_color),
+            surface.blit(self._text(drive_text, self.font, drive_color),
                          (rx + 6, info_y + 28))
 
         # Save brush button
         btn_y = ry + TILE_PREVIEW_SIZE + 80
         btn_rect = pygame.Rect(rx + 8, btn_y, self.rect.width - 16, 22)
-        mx, my = pygame.mouse.get_pos()
+        mx, my = self.mouse_pos
         btn_col = COL_BTN_HOVER if btn_rect.collidepoint(mx, my) else COL_BTN
         pygame.draw.rect(surface, btn_col, btn_rect, border_radius=3)
         pygame.draw.rect(surface, COL_PANEL_BORDER, btn_rect, 1, border_radius=3)
-        lbl = self.font.render("[Save Brush]", True, COL_LIGHT_GRAY)
+        lbl = self._text("[Save Brush]", self.font, COL_LIGHT_GRAY)
         surface.blit(lbl, (btn_rect.x + (btn_rect.width - lbl.get_width()) // 2,
                            btn_rect.y + 4))
 
         # Saved brushes list
         list_y = btn_y + 28
-        surface.blit(self.font.render("Brushes:", True, COL_GRAY),
+        surface.blit(self._text("Brushes:", self.font, COL_GRAY),
                      (rx + 6, list_y))
         list_y += 16
         for i, brush in enumerate(self.brush_library.brushes):
@@ -593,7 +815,7 @@ class ToolsPanel(Panel):
             if iy - ry > self.rect.height - 4:
                 break
             lbl = f"{brush.name} ({brush.width}x{brush.height})"
-            surface.blit(self.font.render(lbl, True, COL_LIGHT_GRAY), (rx + 10, iy))
+            surface.blit(self._text(lbl, self.font, COL_LIGHT_GRAY), (rx + 10, iy))
 
 
 # ══════════════════════════════════════════════
@@ -610,6 +832,18 @@ class PropertyInspector(Panel):
         self.font_small = pygame.font.SysFont("consolas", 11)
 
         self._tile_id = None  # currently inspected tile
+        self._preview = None  # 24px sprite of _tile_id, scaled in set_tile
+
+        # Clickable rows as (y_top, y_bottom, handler(meta)), sorted by
+        # y_top, relative to the panel top
+        self._rows = [
+            (36, 54, self._cycle_category),   # Category row (~40)
+            (54, 72, self._cycle_friction),   # Friction row (~58)
+            (72, 90, self._toggle_blocks),    # Blocks movement row (~76)
+            (90, 108, self._cycle_collision),  # Collision type row (~94)
+            (110, 130, self._open_polygon),   # Edit Polygon button (~114)
+        ]
+        self._row_tops = [top for top, _, _ in self._rows]
 
         # Callbacks
         self.on_open_collision_editor = None  # fn(tile_id)
@@ -619,7 +853,12 @@ class PropertyInspector(Panel):
         return self._tile_id
 
     def set_tile(self, tile_id: int | None):
+        if tile_id == self._tile_id:
+            return
         self._tile_id = tile_id
+        sprite = get_tile_sprite(tile_id) if tile_id is not None else None
+        self._preview = (pygame.transform.scale(sprite, (24, 24))
+                         if sprite is not None else None)
 
     def handle_event(self, event) -> bool:
         if self._tile_id is None:
@@ -630,65 +869,57 @@ class PropertyInspector(Panel):
         if not self.contains(sx, sy):
             return False
 
+        # Which clickable row (if any) the click landed in
         py = sy - self.rect.y
-        mgr = get_manager()
-        meta = mgr.get(self._tile_id)
-
-        # Category row (~40)
-        if 36 <= py < 54:
-            idx = ALL_CATEGORIES.index(meta.category) if meta.category in ALL_CATEGORIES else 0
-            idx = (idx + 1) % len(ALL_CATEGORIES)
-            meta.category = ALL_CATEGORIES[idx]
-            # Auto-set blocks_movement based on category
-            if meta.category in (META_TERRAIN, META_SPECIAL):
-                meta.blocks_movement = False
-                if meta.collision_type == COLL_FULL:
-                    meta.collision_type = COLL_NONE
-            elif meta.category in (META_OBSTACLES,):
-                meta.blocks_movement = True
-                if meta.collision_type == COLL_NONE:
-                    meta.collision_type = COLL_FULL
-            mgr.set(self._tile_id, meta)
-            mgr.save()
-            return True
-
-        # Friction row (~58)
-        if 54 <= py < 72:
-            try:
-                idx = FRICTION_PRESETS.index(meta.friction)
-            except ValueError:
-                idx = -1
-            idx = (idx + 1) % len(FRICTION_PRESETS)
-            meta.friction = FRICTION_PRESETS[idx]
-            mgr.set(self._tile_id, meta)
-            mgr.save()
-            return True
-
-        # Blocks movement row (~76)
-        if 72 <= py < 90:
-            meta.blocks_movement = not meta.blocks_movement
-            mgr.set(self._tile_id, meta)
-            mgr.save()
-            return True
-
-        # Collision type row (~94)
-        if 90 <= py < 108:
-            idx = COLLISION_TYPES.index(meta.collision_type) if meta.collision_type in COLLISION_TYPES else 0
-            idx = (idx + 1) % len(COLLISION_TYPES)
-            meta.collision_type = COLLISION_TYPES[idx]
-            if meta.collision_type == COLL_POLYGON and meta.collision_polygon is None:
-                meta.collision_polygon = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]
-            mgr.set(self._tile_id, meta)
-            mgr.save()
-            return True
-
-        # Edit Polygon button (~114)
-        if 110 <= py < 130:
-            if meta.collision_type == COLL_POLYGON and self.on_open_collision_editor:
-                self.on_open_collision_editor(self._tile_id)
-            return True
+        i = bisect_right(self._row_tops, py) - 1
+        if i < 0 or py >= self._rows[i][1]:
+            return False
+        self._rows[i][2](get_manager().get(self._tile_id))
+        return True
 
-        return False
+    def _commit(self, meta):
+        # Written out by the editor's update once the clicking stops
+        get_manager().set(self._tile_id, meta)
+
+    def _cycle_category(self, meta):
+        idx = ALL_CATEGORIES.index(meta.category) if meta.category in ALL_CATEGORIES else 0
+        idx = (idx + 1) % len(ALL_CATEGORIES)
+        meta.category = ALL_CATEGORIES[idx]
+        # Auto-set blocks_movement based on category
+        if meta.category in (META_TERRAIN, META_SPECIAL):
+            meta.blocks_movement = False
+            if meta.collision_type == COLL_FULL:
+                meta.collision_type = COLL_NONE
+        elif meta.category in (META_OBSTACLES,):
+            meta.blocks_movement = True
+            if meta.collision_type == COLL_NONE:
+                meta.collision_type = COLL_FULL
+        self._commit(meta)
+
+    def _cycle_friction(self, meta):
+        try:
+            idx = FRICTION_PRESETS.index(meta.friction)
+        except ValueError:
+            idx = -1
+        idx = (idx + 1) % len(FRICTION_PRESETS)
+        meta.friction = FRICTION_PRESETS[idx]
+        self._commit(meta)
+
+    def _toggle_blocks(self, meta):
+        meta.blocks_movement = not meta.blocks_movement
+        self._commit(meta)
+
+    def _cycle_collision(self, meta):
+        idx = COLLISION_TYPES.index(meta.collision_type) if meta.collision_type in COLLISION_TYPES else 0
+        idx = (idx + 1) % len(COLLISION_TYPES)
+        meta.collision_type = COLLISION_TYPES[idx]
+        if meta.collision_type == COLL_POLYGON and meta.collision_polygon is None:
+            meta.collision_polygon = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]
+        self._commit(meta)
+
+    def _open_polygon(self, meta):
+        if meta.collision_type == COLL_POLYGON and self.on_open_collision_editor:
+            self.on_open_collision_editor(self._tile_id)
 
     def draw(self, surface: pygame.Surface):
         pygame.draw.rect(surface, COL_PANEL_BG, self.rect)
@@ -697,11 +928,11 @@ class PropertyInspector(Panel):
         rx, ry = self.rect.x + 6, self.rect.y
 
         # Title
-        surface.blit(self.font_title.render("Properties", True, COL_YELLOW),
+        surface.blit(self._text("Properties", self.font_title, COL_YELLOW),
                      (rx, ry + 4))
 
         if self._tile_id is None:
-            surface.blit(self.font.render("No tile selected", True, COL_GRAY),
+            surface.blit(self._text("No tile selected", self.font, COL_GRAY),
                          (rx, ry + 26))
             return
 
@@ -709,16 +940,14 @@ class PropertyInspector(Panel):
         meta = mgr.get(self._tile_id)
 
         # Tile preview
-        sprite = get_tile_sprite(self._tile_id)
-        if sprite is not None:
-            preview = pygame.transform.scale(sprite, (24, 24))
-            surface.blit(preview, (self.rect.right - 34, ry + 4))
+        if self._preview is not None:
+            surface.blit(self._preview, (self.rect.right - 34, ry + 4))
 
         y = ry + 22
         row_h = 18
 
         # ID
-        surface.blit(self.font_small.render(f"ID: {self._tile_id}", True, COL_GRAY),
+        surface.blit(self._text(f"ID: {self._tile_id}", self.font_small, COL_GRAY),
                      (rx, y))
         y += row_h
 
@@ -730,54 +959,54 @@ class PropertyInspector(Panel):
             META_OBSTACLES: (220, 100, 80),
             META_SPECIAL: (220, 200, 50),
         }.get(meta.category, COL_WHITE)
-        surface.blit(self.font.render("Category:", True, COL_LIGHT_GRAY), (rx, y))
-        surface.blit(self.font.render(f"[{cat_name}]", True, cat_color),
+        surface.blit(self._text("Category:", self.font, COL_LIGHT_GRAY), (rx, y))
+        surface.blit(self._text(f"[{cat_name}]", self.font, cat_color),
                      (rx + 72, y))
         y += row_h
 
         # Friction (clickable)
-        surface.blit(self.font.render("Friction:", True, COL_LIGHT_GRAY), (rx, y))
+        surface.blit(self._text("Friction:", self.font, COL_LIGHT_GRAY), (rx, y))
         fric_color = COL_WHITE
         if meta.friction < 0.8:
             fric_color = (100, 180, 255)  # icy blue
         elif meta.friction > 1.2:
             fric_color = (220, 160, 60)   # sandy
-        surface.blit(self.font.render(f"[{meta.friction:.1f}]", True, fric_color),
+        surface.blit(self._text(f"[{meta.friction:.1f}]", self.font, fric_color),
                      (rx + 72, y))
         y += row_h
 
         # Blocks movement (toggle)
-        surface.blit(self.font.render("Blocks:", True, COL_LIGHT_GRAY), (rx, y))
+        surface.blit(self._text("Blocks:", self.font, COL_LIGHT_GRAY), (rx, y))
         blk_text = "Yes" if meta.blocks_movement else "No"
         blk_color = (220, 80, 80) if meta.blocks_movement else COL_DRIVEABLE
-        surface.blit(self.font.render(f"[{blk_text}]", True, blk_color),
+        surface.blit(self._text(f"[{blk_text}]", self.font, blk_color),
                      (rx + 72, y))
         y += row_h
 
         # Collision type (cycle)
-        surface.blit(self.font.render("Collision:", True, COL_LIGHT_GRAY), (rx, y))
-        surface.blit(self.font.render(f"[{meta.collision_type}]", True, COL_WHITE),
+        surface.blit(self._text("Collision:", self.font, COL_LIGHT_GRAY), (rx, y))
+        surface.blit(self._text(f"[{meta.collision_type}]", self.font, COL_WHITE),
                      (rx + 72, y))
         y += row_h
 
         # Edit Polygon button
         if meta.collision_type == COLL_POLYGON:
             btn_rect = pygame.Rect(rx, y, self.rect.width - 16, 18)
-            mx, my_mouse = pygame.mouse.get_pos()
+            mx, my_mouse = self.mouse_pos
             btn_col = COL_BTN_HOVER if btn_rect.collidepoint(mx, my_mouse) else COL_BTN
             pygame.draw.rect(surface, btn_col, btn_rect, border_radius=2)
-            lbl = self.font_small.render("[Edit Polygon]", True, COL_LIGHT_GRAY)
+            lbl = self._text("[Edit Polygon]", self.font_small, COL_LIGHT_GRAY)
             surface.blit(lbl, (btn_rect.x + 4, btn_rect.y + 2))
         y += row_h + 4
 
         # Display name
         if meta.display_name:
-            surface.blit(self.font_small.render(f'"{meta.display_name}"', True, COL_GRAY),
+            surface.blit(self._text(f'"{meta.display_name}"', self.font_small, COL_GRAY),
                          (rx, y))
             y += 14
 
         # Tags
         if meta.tags:
             tags_str = ", ".join(meta.tags[:3])
-            surface.blit(self.font_small.render(f"Tags: {tags_str}", True, COL_GRAY),
+            surface.blit(self._text(f"Tags: {tags_str}", self.font_small, COL_GRAY),
                          (rx, y))
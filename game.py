@@ -245,13 +245,19 @@ class Game:
 
     def _handle_events(self):
         """Procesa eventos de Pygame."""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for i, event in enumerate(events):
             if event.type == pygame.QUIT:
                 self.running = False
                 continue
 
             # Editor captura sus propios eventos
             if self.state == STATE_EDITOR and self.editor:
+                # De una racha de MOUSEMOTION solo importa la última posición
+                if (event.type == pygame.MOUSEMOTION
+                        and i + 1 < len(events)
+                        and events[i + 1].type == pygame.MOUSEMOTION):
+                    continue
                 self.editor.handle_event(event)
                 if self.editor.result == "menu":
                     self.state = STATE_MENU
@@ -0,0 +1,51 @@
+"""
+test_tile_brush.py - Brush.paint_at dirty-rect contract.
+
+paint_at returns the touched block, or None when the grid is left as it
+was; the editor only redraws chunks for a non-None result.
+
+Usage: python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tile_brush import Brush
+from tile_defs import GRID_ROWS, GRID_COLS, T_EMPTY
+
+
+def _grids():
+    terrain = np.zeros((GRID_ROWS, GRID_COLS), dtype=np.uint16)
+    rotations = np.zeros((GRID_ROWS, GRID_COLS), dtype=np.uint8)
+    return terrain, rotations
+
+
+def test_single_empty_brush_is_a_no_op():
+    terrain, rotations = _grids()
+    terrain[3, 4] = 42
+    before = terrain.copy()
+    assert Brush.single(T_EMPTY).paint_at(terrain, 3, 4, rotations) is None
+    assert Brush.single(T_EMPTY).paint_at(terrain, 0, 0, rotations) is None
+    assert np.array_equal(terrain, before)
+
+
+def test_single_tile_repaint_is_a_no_op():
+    terrain, rotations = _grids()
+    brush = Brush.single(42, rotation=1)
+    assert brush.paint_at(terrain, 3, 4, rotations) == (3, 4, 4, 5)
+    assert terrain[3, 4] == 42 and rotations[3, 4] == 1
+    assert brush.paint_at(terrain, 3, 4, rotations) is None
+    # A different rotation is a change
+    assert brush.paint_at(terrain, 3, 4, rotations,
+                          rotation_offset=1) == (3, 4, 4, 5)
+    assert rotations[3, 4] == 2
+
+
+def test_single_tile_outside_grid():
+    terrain, rotations = _grids()
+    assert Brush.single(42).paint_at(terrain, -1, 0, rotations) is None
+    assert Brush.single(42).paint_at(terrain, 0, GRID_COLS, rotations) is None
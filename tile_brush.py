@@ -11,6 +11,7 @@ import json
 import os
 from typing import Optional
 
+import numpy as np
 import pygame
 
 from tile_defs import T_EMPTY, GRID_ROWS, GRID_COLS, get_tile_sprite
@@ -32,6 +33,23 @@ class Brush:
             self.rotations = rotations
         else:
             self.rotations = [[0] * self.width for _ in range(self.height)]
+        # Array mirrors used for stamping (brushes are immutable once built)
+        self._tiles_arr = np.array(tiles, dtype=np.int64).reshape(
+            self.height, self.width)
+        self._rot_arr = np.array(self.rotations, dtype=np.int64).reshape(
+            self.height, self.width)
+        self._mask = self._tiles_arr != T_EMPTY
+        self._solid = bool(self._mask.all())  # no transparent cells
+        # Rotation grid for each rotation_offset, so stamping does no math
+        self._rot_by_offset = [(self._rot_arr + k) % 4 for k in range(4)]
+        # (tile_id, rotation) when every cell is the same painted tile, so
+        # stamping is a plain slice fill (e.g. big fill brushes)
+        self._uniform = None
+        if self._solid:
+            tids = np.unique(self._tiles_arr)
+            rots = np.unique(self._rot_arr)
+            if len(tids) == 1 and len(rots) == 1:
+                self._uniform = (int(tids[0]), int(rots[0]))
 
     @staticmethod
     def single(tile_id: int, rotation: int = 0) -> Brush:
@@ -78,28 +96,66 @@ class Brush:
             tiles.append(row)
         return Brush(tiles)
 
-    def paint_at(self, terrain: list[list[int]], row: int, col: int,
-                 rotations_grid: list[list[int]] | None = None,
-                 rotation_offset: int = 0):
+    def paint_at(self, terrain: np.ndarray, row: int, col: int,
+                 rotations_grid: np.ndarray | None = None,
+                 rotation_offset: int = 0) -> tuple[int, int, int, int] | None:
         """Stamp this brush onto terrain at (row, col).
         T_EMPTY cells in the brush are treated as transparent (not painted).
 
         Args:
-            rotations_grid: the editor's rotation grid to write into.
+            terrain: (GRID_ROWS, GRID_COLS) tile ID array to write into.
+            rotations_grid: the editor's rotation array to write into.
             rotation_offset: additional rotation (0-3) applied to each cell.
+
+        Returns:
+            The touched grid block as (r0, c0, r1, c1), end-exclusive,
+            or None if nothing changed: the brush lies completely outside
+            the grid, or it is a single cell that is transparent or that
+            the grid cell already holds.
         """
-        for dr in range(self.height):
-            for dc in range(self.width):
-                tid = self.tiles[dr][dc]
-                if tid == T_EMPTY:
-                    continue
-                r = row + dr
-                c = col + dc
-                if 0 <= r < GRID_ROWS and 0 <= c < GRID_COLS:
-                    terrain[r][c] = tid
-                    if rotations_grid is not None:
-                        rot = (self.rotations[dr][dc] + rotation_offset) % 4
-                        rotations_grid[r][c] = rot
+        if self.height == 1 and self.width == 1:
+            # Single-tile brush: plain scalar store, the common case
+            if not (0 <= row < GRID_ROWS and 0 <= col < GRID_COLS):
+                return None
+            if self._uniform is None:
+                return None  # transparent cell: nothing is painted
+            tid, rot = self._uniform
+            rot = (rot + rotation_offset) % 4
+            if terrain[row, col] == tid and (
+                    rotations_grid is None
+                    or rotations_grid[row, col] == rot):
+                return None  # repainting the same tile
+            terrain[row, col] = tid
+            if rotations_grid is not None:
+                rotations_grid[row, col] = rot
+            return row, col, row + 1, col + 1
+        r0, r1 = max(0, row), min(GRID_ROWS, row + self.height)
+        c0, c1 = max(0, col), min(GRID_COLS, col + self.width)
+        if r0 >= r1 or c0 >= c1:
+            return None
+        if self._uniform is not None:
+            tid, rot = self._uniform
+            terrain[r0:r1, c0:c1] = tid
+            if rotations_grid is not None:
+                rotations_grid[r0:r1, c0:c1] = (rot + rotation_offset) % 4
+            return r0, c0, r1, c1
+        # Part of the brush that lands inside the grid
+        br, bc = r0 - row, c0 - col
+        cells = (slice(br, br + r1 - r0), slice(bc, bc + c1 - c0))
+        rots = self._rot_by_offset[rotation_offset % 4][cells]
+        if self._solid:
+            # Every cell is painted: plain block copies, no mask
+            terrain[r0:r1, c0:c1] = self._tiles_arr[cells]
+            if rotations_grid is not None:
+                rotations_grid[r0:r1, c0:c1] = rots
+            return r0, c0, r1, c1
+        mask = self._mask[cells]
+        np.copyto(terrain[r0:r1, c0:c1], self._tiles_arr[cells],
+                  where=mask, casting="unsafe")
+        if rotations_grid is not None:
+            np.copyto(rotations_grid[r0:r1, c0:c1], rots,
+                      where=mask, casting="unsafe")
+        return r0, c0, r1, c1
 
     def get_preview_surface(self, cell_size: int = 32,
                             rotation_offset: int = 0) -> pygame.Surface:
@@ -164,7 +220,9 @@ class BrushLibrary:
                 with open(path, "r", encoding="utf-8") as f:
                     data = json.load(f)
                 self.brushes.append(Brush.from_dict(data))
-            except (json.JSONDecodeError, OSError, KeyError):
+            except (json.JSONDecodeError, OSError, KeyError,
+                    ValueError, TypeError):
+                # Unreadable, or tiles/rotations not a rectangular int grid
                 continue
 
     def save_brush(self, brush: Brush):
@@ -16,6 +16,8 @@ import pygame
 # GRID
 # ──────────────────────────────────────────────
 TILE_SIZE = 64
+assert TILE_SIZE & (TILE_SIZE - 1) == 0, "TILE_SIZE must be a power of two"
+LOG2_TILE_SIZE = TILE_SIZE.bit_length() - 1  # px -> tile is `>> LOG2_TILE_SIZE`
 TILE_BASE_PX = 16
 GRID_COLS = 56   # WORLD_WIDTH (3600) / TILE_SIZE
 GRID_ROWS = 37   # WORLD_HEIGHT (2400) / TILE_SIZE
@@ -52,7 +54,7 @@ GRASS_DARK = (55, 148, 46)
 _loaded = False
 _tiles = []        # list of tile info dicts
 _sprites = {}      # tile_id -> Surface(64x64)
-_rotated_sprites = {}  # (tile_id, rotation) -> Surface(64x64)
+_sprite_atlas = []  # tile_id * 4 + rotation -> Surface(64x64), None = not built
 _categories = {}   # category -> [tile_id, ...]
 _road_ids = set()  # driveable tile IDs
 _tileset_sheet = None   # original tileset Surface (preserved for browser)
@@ -70,7 +72,7 @@ def _ensure_loaded():
 
 
 def _do_load():
-    global _tiles, _sprites, _categories, _road_ids
+    global _tiles, _sprites, _sprite_atlas, _categories, _road_ids
     global _tileset_sheet, _position_map, TILESET_COLS, TILESET_ROWS
     from utils.sprites import load_image
 
@@ -152,7 +154,9 @@ def _do_load():
             sub = pygame.Surface((TILE_BASE_PX, TILE_BASE_PX), pygame.SRCALPHA)
             sub.blit(sheet, (0, 0),
                      pygame.Rect(bx, by, TILE_BASE_PX, TILE_BASE_PX))
-            scaled = pygame.transform.scale(sub, (TILE_SIZE, TILE_SIZE))
+            # Display pixel format so blits take SDL's fast path
+            scaled = pygame.transform.scale(
+                sub, (TILE_SIZE, TILE_SIZE)).convert_alpha()
 
             tile_id = TILE_BASE + len(_tiles)
             _tiles.append({
@@ -169,6 +173,11 @@ def _do_load():
             if driveable:
                 _road_ids.add(tile_id)
 
+    # Unrotated sprites go straight in; rotations are filled on first use
+    _sprite_atlas = [None] * ((TILE_BASE + len(_tiles)) * 4)
+    for tile_id, sprite in _sprites.items():
+        _sprite_atlas[tile_id * 4] = sprite
+
     print(f"[tile_defs] Loaded {len(_tiles)} tiles: "
           f"{len(_categories[CAT_ROAD])} road, "
           f"{len(_categories[CAT_NATURE])} nature, "
@@ -246,17 +255,19 @@ def get_tile_sprite(tile_id, rotation=0):
     if tile_id == T_EMPTY:
         return None
     _ensure_loaded()
-    if rotation == 0:
-        return _sprites.get(tile_id)
-    key = (tile_id, rotation)
-    if key not in _rotated_sprites:
-        base = _sprites.get(tile_id)
+    rotation &= 3  # quarter turns wrap around
+    idx = tile_id * 4 + rotation
+    if not 0 <= idx < len(_sprite_atlas):
+        return None
+    sprite = _sprite_atlas[idx]
+    if sprite is None and rotation:
+        base = _sprite_atlas[tile_id * 4]
         if base is None:
             return None
         # pygame rotates counter-clockwise, so negate for clockwise
-        angle = rotation * -90
-        _rotated_sprites[key] = pygame.transform.rotate(base, angle)
-    return _rotated_sprites[key]
+        sprite = pygame.transform.rotate(base, rotation * -90)
+        _sprite_atlas[idx] = sprite
+    return sprite
 
 
 def get_tiles_by_category(category):
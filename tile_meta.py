@@ -19,8 +19,10 @@ Migration from legacy:
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import time
 from dataclasses import dataclass, field, asdict
 from typing import Optional
 
@@ -49,6 +51,9 @@ COLL_POLYGON = "polygon"
 
 COLLISION_TYPES = [COLL_NONE, COLL_FULL, COLL_POLYGON]
 
+# Seconds without further edits before a deferred save (see flush)
+SAVE_DELAY = 0.5
+
 # Path to the metadata JSON
 from utils.base_path import ASSETS_DIR
 _META_DIR = os.path.join(ASSETS_DIR, "levels")
@@ -108,6 +113,9 @@ class TileMetadataManager:
         self._data: dict[int, TileMeta] = {}
         self._loaded = False
         self._dirty = False
+        self._revision = 0  # bumped whenever tile data changes
+        self._changed_at = 0.0  # time.monotonic() of the last set()
+        self._category_table = (None, [])  # (revision, categories by ID)
 
     # ── Loading ──
 
@@ -120,6 +128,7 @@ class TileMetadataManager:
         else:
             self._auto_generate()
             self.save()
+        self._revision += 1
 
     def _load_json(self):
         try:
@@ -188,6 +197,18 @@ class TileMetadataManager:
         except OSError as e:
             print(f"[tile_meta] ERROR saving: {e}")
 
+    def flush(self, idle: float = 0.0):
+        """Save pending changes once nothing has changed for `idle` seconds.
+
+        Lets a burst of edits share one write: call with SAVE_DELAY every
+        frame, and with no argument when the edits must reach disk now.
+        """
+        if not self._dirty or time.monotonic() - self._changed_at < idle:
+            return
+        # A failed write is retried after another idle period, not per call
+        self._changed_at = time.monotonic()
+        self.save()
+
     # ── Public API ──
 
     def get(self, tile_id: int) -> TileMeta:
@@ -201,6 +222,8 @@ class TileMetadataManager:
         self._ensure_loaded()
         self._data[tile_id] = meta
         self._dirty = True
+        self._changed_at = time.monotonic()
+        self._revision += 1
 
     def is_driveable(self, tile_id: int) -> bool:
         self._ensure_loaded()
@@ -220,6 +243,21 @@ class TileMetadataManager:
             return self._data[tile_id].category
         return META_OBSTACLES
 
+    def category_table(self, min_size: int = 0) -> list[str]:
+        """Category of every tile ID as a list indexed by ID, padded with
+        the unknown-tile default to at least min_size entries.  Built once
+        per revision; callers must not modify it."""
+        self._ensure_loaded()
+        rev, table = self._category_table
+        if rev != self._revision or len(table) < min_size:
+            size = max(min_size, max(self._data, default=-1) + 1)
+            table = [META_OBSTACLES] * size
+            for tid, m in self._data.items():
+                if tid >= 0:
+                    table[tid] = m.category
+            self._category_table = (self._revision, table)
+        return table
+
     def get_tiles_by_category(self, category: str) -> list[int]:
         self._ensure_loaded()
         return [tid for tid, m in self._data.items() if m.category == category]
@@ -232,10 +270,17 @@ class TileMetadataManager:
     def dirty(self) -> bool:
         return self._dirty
 
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever tile data does (for caches)."""
+        return self._revision
+
 
 def get_manager() -> TileMetadataManager:
     """Return the singleton TileMetadataManager."""
     global _manager
     if _manager is None:
         _manager = TileMetadataManager()
+        # Deferred edits still reach disk if the process exits first
+        atexit.register(_manager.flush)
     return _manager
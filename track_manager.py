@@ -107,12 +107,12 @@ def save_tile_track(filename, name, terrain, tile_overrides=None,
 
     # Embed driveable tile IDs so dedicated servers don't need tileset.png
     from tile_defs import is_driveable as _td_is_driveable, T_EMPTY
-    driveable_ids = set()
+    used_ids = set()
     for row in terrain:
-        for tid in row:
-            if tid != T_EMPTY and _td_is_driveable(tid):
-                driveable_ids.add(tid)
-    data["driveable_tiles"] = sorted(driveable_ids)
+        used_ids.update(row)
+    used_ids.discard(T_EMPTY)
+    data["driveable_tiles"] = sorted(
+        tid for tid in used_ids if _td_is_driveable(tid))
 
     filepath = os.path.join(TRACKS_DIR, filename)
     with open(filepath, "w", encoding="utf-8") as f:
@@ -147,33 +147,57 @@ def load_track(filename):
     return data
 
 
+# Entradas ya parseadas por list_tracks: path -> (mtime, size, entry)
+_list_cache = {}
+
+
 def list_tracks():
     """Lista las pistas disponibles ordenadas por fecha de modificación (más reciente primero).
 
+    Solo se vuelve a parsear el JSON de los archivos cuyo mtime o tamaño
+    cambió desde la última llamada; el resto sale de _list_cache.
+
     Returns:
         lista de dicts con keys: filename, name, path, modified, type.
     """
     _ensure_tracks_dir()
     tracks = []
-    for fname in os.listdir(TRACKS_DIR):
+    seen = set()
+    for dirent in os.scandir(TRACKS_DIR):
+        fname = dirent.name
         if not fname.endswith(".json"):
             continue
         filepath = os.path.join(TRACKS_DIR, fname)
+        try:
+            st = dirent.stat()
+        except OSError:
+            continue
+        seen.add(filepath)
+        cached = _list_cache.get(filepath)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            tracks.append(dict(cached[2]))
+            continue
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
             track_type = "tiles" if (data.get("format") == "tiles" or "terrain" in data) else "classic"
 
-            tracks.append({
+            entry = {
                 "filename": fname,
                 "name": data.get("name", fname),
                 "path": filepath,
-                "modified": os.path.getmtime(filepath),
+                "modified": st.st_mtime,
                 "type": track_type,
-            })
+            }
         except (json.JSONDecodeError, OSError):
+            _list_cache.pop(filepath, None)
             continue
+        _list_cache[filepath] = (st.st_mtime, st.st_size, entry)
+        tracks.append(dict(entry))
+    # Olvidar archivos borrados
+    for filepath in [p for p in _list_cache if p not in seen]:
+        del _list_cache[filepath]
     tracks.sort(key=lambda t: t["modified"], reverse=True)
     return tracks
 